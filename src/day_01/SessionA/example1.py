@@ -1,18 +1,9 @@
-import pyodbc
+from day_02.SessionB.data_access import odbc_data_source
 
-# Replace with your server & database
-conn = pyodbc.connect(
-    "DRIVER={ODBC Driver 17 for SQL Server};"
-    "SERVER=localhost,1433;"
-    "DATABASE=AdventureWorks2022;"
-    "UID=sa;"
-    "PWD=passw0rd;"
-)
+# Server & credentials come from BI_DB_SERVER, BI_DB_UID and BI_DB_PWD
+source = odbc_data_source("AdventureWorks2022", driver="ODBC Driver 17 for SQL Server")
 
-cursor = conn.cursor()
-
-cursor.execute("select top 10 [AddressID], [AddressLine1] from [Person].[Address]")
-rows = cursor.fetchall()
+rows = source.query("select top 10 [AddressID], [AddressLine1] from [Person].[Address]")
 
 for row in rows:
     print(row)
\ No newline at end of file
@@ -0,0 +1,128 @@
+import numpy as np
+
+
+class ColumnarSales:
+    """Columnar (NumPy) storage for sales records.
+
+    Product is dictionary-encoded: every distinct name is stored once in
+    `products` and each row keeps only an int32 code. Revenue and Cost are
+    float64 arrays, so one row costs about 20 bytes instead of a dict.
+    """
+
+    def __init__(self, products: list, codes, revenue, cost):
+        """
+        Args:
+            products (list of str): Distinct product names, in order of first appearance.
+            codes (array of int): Index into `products` for every row.
+            revenue (array of float): Revenue for every row.
+            cost (array of float): Cost for every row.
+        """
+        self.products = list(products)
+        self._codes = np.asarray(codes, dtype=np.int32)
+        self._revenue = np.asarray(revenue, dtype=np.float64)
+        self._cost = np.asarray(cost, dtype=np.float64)
+        self._size = len(self._codes)
+        self._lookup = {product: code for code, product in enumerate(products)}
+
+    # the buffers may be longer than the data (room for appends); expose only the rows
+    @property
+    def codes(self):
+        return self._codes[:self._size]
+
+    @property
+    def revenue(self):
+        return self._revenue[:self._size]
+
+    @property
+    def cost(self):
+        return self._cost[:self._size]
+
+    @classmethod
+    def from_records(cls, sales_data: list[dict]) -> "ColumnarSales":
+        """Encode a list of {'Product', 'Revenue', 'Cost'} dicts into columns."""
+        lookup = {}
+        codes = np.empty(len(sales_data), dtype=np.int32)
+        revenue = np.empty(len(sales_data), dtype=np.float64)
+        cost = np.empty(len(sales_data), dtype=np.float64)
+        for i, item in enumerate(sales_data):
+            codes[i] = lookup.setdefault(item["Product"], len(lookup))
+            revenue[i] = item["Revenue"]
+            cost[i] = item["Cost"]
+        return cls(list(lookup), codes, revenue, cost)
+
+    def extend(self, sales_data: list[dict]):
+        """Encode more {'Product', 'Revenue', 'Cost'} dicts and add them as rows.
+
+        The buffers grow geometrically, so appending is amortized O(1) per row.
+        """
+        n = len(sales_data)
+        end = self._size + n
+        if end > len(self._codes):
+            capacity = max(end, 2 * len(self._codes))
+            self._codes = np.resize(self._codes, capacity)
+            self._revenue = np.resize(self._revenue, capacity)
+            self._cost = np.resize(self._cost, capacity)
+        self._codes[self._size:end] = np.fromiter(
+            (self._encode(item["Product"]) for item in sales_data), dtype=np.int32, count=n)
+        self._revenue[self._size:end] = [item["Revenue"] for item in sales_data]
+        self._cost[self._size:end] = [item["Cost"] for item in sales_data]
+        self._size = end
+
+    def _encode(self, product) -> int:
+        code = self._lookup.get(product)
+        if code is None:
+            code = self._lookup[product] = len(self.products)
+            self.products.append(product)
+        return code
+
+    def copy(self) -> "ColumnarSales":
+        """Independent copy: extending one does not change the other."""
+        return ColumnarSales(self.products, self.codes.copy(), self.revenue.copy(), self.cost.copy())
+
+    def to_records(self) -> list[dict]:
+        """Decode the columns back into {'Product', 'Revenue', 'Cost'} dicts."""
+        return [
+            {"Product": self.products[code], "Revenue": revenue, "Cost": cost}
+            for code, revenue, cost in zip(self.codes.tolist(), self.revenue.tolist(), self.cost.tolist())
+        ]
+
+    def __len__(self):
+        return self._size
+
+    def nbytes(self) -> int:
+        """Memory used by the row columns (the product dictionary is not counted)."""
+        return self.codes.nbytes + self.revenue.nbytes + self.cost.nbytes
+
+    def total_revenue(self) -> float:
+        return float(self.revenue.sum())
+
+    def total_profit(self) -> float:
+        return float((self.revenue - self.cost).sum())
+
+    def best_product(self) -> str:
+        # argmax returns the first maximum, like max() on the row list
+        return self.products[self.codes[np.argmax(self.revenue)]]
+
+    def profit_margins(self) -> dict:
+        """Return dictionary of products and their profit margins %.
+
+        Like the row-based version, a product that appears more than once
+        keeps the margin of its last row.
+        """
+        margins = (self.revenue - self.cost) / self.revenue * 100
+        last_row = np.full(len(self.products), -1, dtype=np.int64)
+        np.maximum.at(last_row, self.codes, np.arange(len(self.codes)))
+        return {
+            product: round(float(margins[row]), 2)
+            for product, row in zip(self.products, last_row)
+        }
+
+    def aggregates(self) -> dict:
+        """Return every KPI used by SalesAnalytics, computed from the columns."""
+        return {
+            "total_revenue": self.total_revenue(),
+            "total_profit": self.total_profit(),
+            "count": len(self.codes),
+            "best_product": self.best_product() if len(self.codes) else None,
+            "profit_margins": self.profit_margins(),
+        }
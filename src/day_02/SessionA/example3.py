@@ -1,32 +1,116 @@
+from day_02.SessionA.columnar import ColumnarSales
+from day_02.SessionA.groupby import group_by, group_by_codes
+
+
 class SalesAnalytics:
-    """A simple Business Intelligence class for sales analysis without pandas."""
+    """A simple Business Intelligence class for sales analysis without pandas.
 
-    def __init__(self, sales_data: list[dict]):
+    Totals, best product and margins are computed together in one pass and
+    cached on the instance. Change the data through `append`, `extend` or
+    `replace` so the cache is invalidated; `cache_hits` and `cache_misses`
+    count how often the cached aggregates were reused.
+    """
+
+    def __init__(self, sales_data: list[dict] | ColumnarSales, columnar: bool = False):
         """
         Args:
             sales_data (list of dict): Each dict must contain 
                                        'Product', 'Revenue', and 'Cost'.
+                                       In columnar mode a ColumnarSales is accepted too.
+            columnar (bool): Store the data as NumPy columns only (no row
+                             list) and answer with vectorized reductions
+                             (for large datasets).
         """
-        self.sales_data = sales_data
+        self.columnar = columnar
+        self.sales_data = None
+        self.columns = None
+        self._store(sales_data)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._aggregates = None
+
+    # ---- mutation (invalidates the cache) ----
+    def append(self, record: dict):
+        """Add one sales record."""
+        self.extend([record])
+
+    def extend(self, records: list[dict]):
+        """Add several sales records."""
+        if self.columnar:
+            self.columns.extend(records)
+        else:
+            self.sales_data.extend(records)
+        self._invalidate()
+
+    def replace(self, sales_data: list[dict]):
+        """Replace all sales records."""
+        self._store(sales_data)
+        self._invalidate()
+
+    def _store(self, sales_data):
+        # own copy: append/extend must not change the caller's data (or other instances built on it)
+        if not self.columnar:
+            self.sales_data = list(sales_data)
+        elif isinstance(sales_data, ColumnarSales):
+            self.columns = sales_data.copy()
+        else:
+            self.columns = ColumnarSales.from_records(sales_data)
+
+    def _invalidate(self):
+        self._aggregates = None
+
+    # ---- aggregate cache ----
+    def aggregates(self) -> dict:
+        """Return the cached aggregates, computing them in one pass if needed."""
+        if self._aggregates is not None:
+            self.cache_hits += 1
+            return self._aggregates
+        self.cache_misses += 1
+        if self.columnar:
+            self._aggregates = self.columns.aggregates()
+        else:
+            self._aggregates = self._scan()
+        return self._aggregates
+
+    def _scan(self) -> dict:
+        """Compute every aggregate in a single pass over the rows."""
+        revenue = profit = 0
+        best = None
+        margins = {}
+        for item in self.sales_data:
+            item_profit = item["Revenue"] - item["Cost"]
+            revenue += item["Revenue"]
+            profit += item_profit
+            if best is None or item["Revenue"] > best["Revenue"]:
+                best = item
+            margins[item["Product"]] = round(item_profit / item["Revenue"] * 100, 2)
+        return {
+            "total_revenue": revenue,
+            "total_profit": profit,
+            "count": len(self.sales_data),
+            "best_product": best["Product"] if best is not None else None,
+            "profit_margins": margins,
+        }
 
     def total_revenue(self)-> float:
-        return sum(item["Revenue"] for item in self.sales_data)
+        return self.aggregates()["total_revenue"]
 
     def total_profit(self)-> float:
-        return sum(item["Revenue"] - item["Cost"] for item in self.sales_data)
+        return self.aggregates()["total_profit"]
 
     def average_revenue(self)-> float:
-        return round(self.total_revenue() / len(self.sales_data), 2)
+        aggregates = self.aggregates()
+        return round(aggregates["total_revenue"] / aggregates["count"], 2)
 
     def best_product(self)-> str:
-        return max(self.sales_data, key=lambda x: x["Revenue"])  ["Product"]
+        best = self.aggregates()["best_product"]
+        if best is None:
+            raise ValueError("no sales data")
+        return best
 
     def profit_margins(self)-> dict:
         """Return dictionary of products and their profit margins %."""
-        return {
-            item["Product"]: round((item["Revenue"] - item["Cost"]) / item["Revenue"] * 100, 2)
-            for item in self.sales_data
-        }
+        return dict(self.aggregates()["profit_margins"])
 
     def low_margin_products(self, threshold:float=20)-> list:
         """
@@ -38,11 +122,33 @@ class SalesAnalytics:
         Returns:
             list: Names of products with low profit margin.
         """
-        margins = self.profit_margins()
+        margins = self.aggregates()["profit_margins"]
         return [product for product, margin in margins.items() if margin < threshold]
 
+    def group_by(self, keys, aggregations: dict | None = None) -> dict:
+        """
+        Aggregate measures per group in a single pass (hash aggregate).
 
+        Args:
+            keys (str or tuple of str): Column(s) to group by, e.g. 'Product'.
+            aggregations (dict): Measure -> aggregation(s) among 'sum', 'mean',
+                                 'min', 'max', 'count'. Defaults to the sum of
+                                 Revenue and Cost.
 
+        Returns:
+            dict: Columnar result, e.g. {'Product': [...], 'Revenue_sum': [...]}.
+        """
+        if aggregations is None:
+            aggregations = {"Revenue": "sum", "Cost": "sum"}
+        if self.columnar and keys in ("Product", ("Product",)) and set(aggregations) <= {"Revenue", "Cost"}:
+            columns = self.columns
+            return group_by_codes(
+                columns.products, columns.codes,
+                {"Revenue": columns.revenue, "Cost": columns.cost},
+                aggregations, "Product",
+            )
+        rows = self.columns.to_records() if self.columnar else self.sales_data
+        return group_by(rows, keys, aggregations)
 
 
 if __name__ == "__main__":
@@ -63,3 +169,13 @@ if __name__ == "__main__":
     print("Profit Margins:", analytics.profit_margins())  
     print("Low Margin Products (<30%):", analytics.low_margin_products(30))  
 
+    columnar = SalesAnalytics(data, columnar=True)
+    print("Columnar Profit Margins:", columnar.profit_margins())
+    print("Columnar bytes per row:", columnar.columns.nbytes() / len(data))
+
+    analytics.append({"Product": "Monitor", "Revenue": 400, "Cost": 250})
+    print("Total Revenue after append:", analytics.total_revenue())
+    print("Cache hits/misses:", analytics.cache_hits, analytics.cache_misses)
+
+    print("Revenue by Product:", analytics.group_by("Product", {"Revenue": ["sum", "mean", "count"]}))
+
@@ -0,0 +1,117 @@
+import numpy as np
+
+AGGREGATIONS = ("sum", "mean", "min", "max", "count")
+
+
+def _normalize(keys, aggregations):
+    """Turn `keys` into a tuple and `aggregations` into {measure: [agg, ...]}."""
+    if isinstance(keys, str):
+        keys = (keys,)
+    keys = tuple(keys)
+    normalized = {}
+    for measure, aggs in aggregations.items():
+        aggs = [aggs] if isinstance(aggs, str) else list(aggs)
+        for agg in aggs:
+            if agg not in AGGREGATIONS:
+                raise ValueError(f"unknown aggregation {agg!r}, expected one of {AGGREGATIONS}")
+        normalized[measure] = aggs
+    return keys, normalized
+
+
+def _result(keys, aggregations, groups, counts, sums, mins, maxs):
+    """Build the columnar result: one list per key and per measure_agg."""
+    result = {key: [group[i] for group in groups] for i, key in enumerate(keys)}
+    for j, (measure, aggs) in enumerate(aggregations.items()):
+        for agg in aggs:
+            if agg == "sum":
+                column = [s[j] for s in sums]
+            elif agg == "mean":
+                column = [s[j] / c for s, c in zip(sums, counts)]
+            elif agg == "min":
+                column = [m[j] for m in mins]
+            elif agg == "max":
+                column = [m[j] for m in maxs]
+            else:
+                column = list(counts)
+            result[f"{measure}_{agg}"] = column
+    return result
+
+
+def group_by(records: list[dict], keys, aggregations: dict) -> dict:
+    """
+    Hash-aggregate `records` by one or more keys in a single pass.
+
+    Args:
+        records (list of dict): Rows to aggregate.
+        keys (str or tuple of str): Column(s) to group by.
+        aggregations (dict): Measure name -> aggregation or list of
+                             aggregations ('sum', 'mean', 'min', 'max', 'count').
+
+    Returns:
+        dict: Columnar result, e.g. {'Product': [...], 'Revenue_sum': [...]},
+              with groups in order of first appearance.
+    """
+    keys, aggregations = _normalize(keys, aggregations)
+    measures = list(aggregations)
+    index = {}
+    groups, counts, sums, mins, maxs = [], [], [], [], []
+    single_key = keys[0] if len(keys) == 1 else None
+    for record in records:
+        group = (record[single_key],) if single_key is not None else tuple(record[k] for k in keys)
+        values = [record[m] for m in measures]
+        g = index.get(group)
+        if g is None:
+            index[group] = len(groups)
+            groups.append(group)
+            counts.append(1)
+            sums.append(list(values))
+            mins.append(list(values))
+            maxs.append(list(values))
+            continue
+        counts[g] += 1
+        group_sums, group_mins, group_maxs = sums[g], mins[g], maxs[g]
+        for j, value in enumerate(values):
+            group_sums[j] += value
+            if value < group_mins[j]:
+                group_mins[j] = value
+            if value > group_maxs[j]:
+                group_maxs[j] = value
+    return _result(keys, aggregations, groups, counts, sums, mins, maxs)
+
+
+def group_by_codes(labels: list, codes, columns: dict, aggregations: dict, key: str) -> dict:
+    """
+    Vectorized group-by over a dictionary-encoded key (see ColumnarSales).
+
+    Args:
+        labels (list): Distinct key values; `codes` index into it.
+        codes (array of int): Group code for every row.
+        columns (dict): Measure name -> float64 array.
+        aggregations (dict): Same format as for `group_by`.
+        key (str): Name of the key column in the result.
+
+    Returns:
+        dict: Columnar result in the same layout as `group_by`.
+    """
+    _, aggregations = _normalize(key, aggregations)
+    n_groups = len(labels)
+    counts = np.bincount(codes, minlength=n_groups)
+    present = np.flatnonzero(counts)
+    result = {key: [labels[g] for g in present]}
+    for measure, aggs in aggregations.items():
+        values = columns[measure]
+        for agg in aggs:
+            if agg in ("sum", "mean"):
+                column = np.bincount(codes, weights=values, minlength=n_groups)
+                if agg == "mean":
+                    column = column / np.maximum(counts, 1)
+            elif agg == "min":
+                column = np.full(n_groups, np.inf)
+                np.minimum.at(column, codes, values)
+            elif agg == "max":
+                column = np.full(n_groups, -np.inf)
+                np.maximum.at(column, codes, values)
+            else:
+                column = counts
+            result[f"{measure}_{agg}"] = column[present].tolist()
+    return result
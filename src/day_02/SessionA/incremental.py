@@ -0,0 +1,181 @@
+import heapq
+import threading
+
+import numpy as np
+
+
+class IncrementalSalesAnalytics:
+    """Append-only sales analytics with O(1) KPI updates.
+
+    Instead of keeping the rows, the class keeps running sums for revenue and
+    cost, running per-product totals and the best row seen so far. Every
+    `add` updates all of them in constant time, and `snapshot` returns a
+    consistent copy of the KPIs while other threads keep adding records.
+
+    Unlike SalesAnalytics, profit margins are computed from the per-product
+    totals, so a product that appears in several rows gets its overall margin.
+    """
+
+    def __init__(self, sales_data: list[dict] | None = None):
+        """
+        Args:
+            sales_data (list of dict): Optional initial records, each with
+                                       'Product', 'Revenue', and 'Cost'.
+        """
+        self._lock = threading.Lock()
+        self.count = 0
+        self.revenue = 0
+        self.cost = 0
+        self.product_totals = {}   # product -> [revenue, cost]
+        self._best = None          # (revenue, product) of the best row
+        if sales_data:
+            self.extend(sales_data)
+
+    def add(self, record: dict):
+        """Add one sales record and update every KPI."""
+        product, revenue, cost = record["Product"], record["Revenue"], record["Cost"]
+        with self._lock:
+            self._add(product, revenue, cost)
+
+    def extend(self, records):
+        """Add several sales records."""
+        with self._lock:
+            for record in records:
+                self._add(record["Product"], record["Revenue"], record["Cost"])
+
+    def _add(self, product, revenue, cost):
+        self.count += 1
+        self.revenue += revenue
+        self.cost += cost
+        totals = self.product_totals.get(product)
+        if totals is None:
+            self.product_totals[product] = [revenue, cost]
+        else:
+            totals[0] += revenue
+            totals[1] += cost
+        # the running maximum only grows, so no heap is needed here;
+        # strict '>' keeps the first best row, like max() does
+        if self._best is None or revenue > self._best[0]:
+            self._best = (revenue, product)
+
+    def add_columns(self, products, revenue, cost):
+        """
+        Add a batch of records given as columns (e.g. NumPy arrays).
+
+        The batch is reduced per product with bincount first, so the Python
+        work is per distinct product, not per row.
+        """
+        revenue = np.asarray(revenue, dtype=np.float64)
+        cost = np.asarray(cost, dtype=np.float64)
+        if len(revenue) == 0:
+            return
+        labels, first, codes = np.unique(np.asarray(products), return_index=True, return_inverse=True)
+        revenue_sums = np.bincount(codes, weights=revenue, minlength=len(labels))
+        cost_sums = np.bincount(codes, weights=cost, minlength=len(labels))
+        best = int(np.argmax(revenue))
+        labels = labels.tolist()
+        with self._lock:
+            self.count += len(revenue)
+            self.revenue += float(revenue.sum())
+            self.cost += float(cost.sum())
+            # visit products in order of first appearance, like _add does
+            for g in np.argsort(first, kind="stable"):
+                product = labels[g]
+                totals = self.product_totals.get(product)
+                if totals is None:
+                    self.product_totals[product] = [float(revenue_sums[g]), float(cost_sums[g])]
+                else:
+                    totals[0] += float(revenue_sums[g])
+                    totals[1] += float(cost_sums[g])
+            if self._best is None or revenue[best] > self._best[0]:
+                self._best = (float(revenue[best]), labels[codes[best]])
+
+    def merge(self, other: "IncrementalSalesAnalytics"):
+        """Fold the state of `other` (e.g. a partial result from a worker) into this one.
+
+        Merging partial results in data order gives the same best product and
+        product order as adding the rows one by one.
+        """
+        with self._lock:
+            self.count += other.count
+            self.revenue += other.revenue
+            self.cost += other.cost
+            for product, (revenue, cost) in other.product_totals.items():
+                totals = self.product_totals.get(product)
+                if totals is None:
+                    self.product_totals[product] = [revenue, cost]
+                else:
+                    totals[0] += revenue
+                    totals[1] += cost
+            if other._best is not None and (self._best is None or other._best[0] > self._best[0]):
+                self._best = other._best
+
+    def __getstate__(self):
+        # locks cannot be pickled; needed to send partial results between processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def total_revenue(self) -> float:
+        return self.revenue
+
+    def total_profit(self) -> float:
+        return self.revenue - self.cost
+
+    def average_revenue(self) -> float:
+        return round(self.revenue / self.count, 2)
+
+    def best_product(self) -> str:
+        if self._best is None:
+            raise ValueError("no sales data")
+        return self._best[1]
+
+    def profit_margins(self) -> dict:
+        """Return dictionary of products and their overall profit margins %."""
+        with self._lock:
+            totals = [(product, rev, cost) for product, (rev, cost) in self.product_totals.items()]
+        return {product: round((rev - cost) / rev * 100, 2) for product, rev, cost in totals}
+
+    def low_margin_products(self, threshold: float = 20) -> list:
+        margins = self.profit_margins()
+        return [product for product, margin in margins.items() if margin < threshold]
+
+    def top_products(self, n: int = 5) -> list:
+        """Return the `n` products with the highest total revenue as (product, revenue)."""
+        with self._lock:
+            totals = [(product, rev) for product, (rev, _) in self.product_totals.items()]
+        return heapq.nlargest(n, totals, key=lambda item: item[1])
+
+    def snapshot(self) -> dict:
+        """Return a consistent copy of all KPIs without blocking ingestion for long."""
+        with self._lock:
+            count, revenue, cost, best = self.count, self.revenue, self.cost, self._best
+            totals = {product: tuple(values) for product, values in self.product_totals.items()}
+        return {
+            "count": count,
+            "total_revenue": revenue,
+            "total_profit": revenue - cost,
+            "average_revenue": round(revenue / count, 2) if count else 0,
+            "best_product": best[1] if best else None,
+            "product_totals": totals,
+        }
+
+
+if __name__ == "__main__":
+    analytics = IncrementalSalesAnalytics()
+    feed = [
+        {"Product": "Laptop", "Revenue": 1200, "Cost": 800},
+        {"Product": "Tablet", "Revenue": 350, "Cost": 300},
+        {"Product": "Smartphone", "Revenue": 800, "Cost": 600},
+        {"Product": "Tablet", "Revenue": 360, "Cost": 300},
+    ]
+    for record in feed:
+        analytics.add(record)
+        print("Snapshot:", analytics.snapshot())
+
+    print("Profit Margins:", analytics.profit_margins())
+    print("Top Products:", analytics.top_products(2))
@@ -0,0 +1,58 @@
+"""
+Throughput benchmark: DOM loader (ET.parse) vs streaming loader (iterparse)
+of XMLSalesAnalytics.
+
+Writes a synthetic <SalesData> file, loads it both ways and reports
+rows/s and peak Python memory (tracemalloc).
+
+    python -m day_02.SessionB.benchmark_xml 200000
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from day_02.SessionB.example3 import XMLSalesAnalytics
+
+
+def write_sales_xml(path, rows, seed=42):
+    """Write `rows` random <Sale> elements to `path`."""
+    rnd = random.Random(seed)
+    products = ["Laptop", "Tablet", "Phone", "Monitor", "Keyboard", "Mouse"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<SalesData>\n")
+        for _ in range(rows):
+            revenue = round(rnd.uniform(100, 2000), 2)
+            cost = round(revenue * rnd.uniform(0.4, 0.95), 2)
+            f.write(
+                f"    <Sale>\n        <Product>{rnd.choice(products)}</Product>\n"
+                f"        <Revenue>{revenue}</Revenue>\n        <Cost>{cost}</Cost>\n    </Sale>\n"
+            )
+        f.write("</SalesData>\n")
+
+
+def measure(xml_file, stream):
+    """Load `xml_file` and return (seconds, peak bytes, total revenue)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    analytics = XMLSalesAnalytics(xml_file, stream=stream)
+    revenue = analytics.total_revenue()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, revenue
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = os.path.join(tmp, "sales.xml")
+        write_sales_xml(xml_file, rows)
+        size_mb = os.path.getsize(xml_file) / 1e6
+        print(f"{rows:,} sales, {size_mb:.1f} MB")
+        for name, stream in (("DOM (ET.parse)", False), ("Streaming (iterparse)", True)):
+            elapsed, peak, revenue = measure(xml_file, stream)
+            print(f"{name:22} {rows / elapsed:>12,.0f} rows/s  peak {peak / 1e6:8.1f} MB  revenue {revenue:,.2f}")
@@ -0,0 +1,240 @@
+"""
+Small data-access layer for the ODBC data sources.
+
+- ConnectionPool: thread-safe pool that reuses open connections and runs a
+  health check before handing one out.
+- QueryCache: LRU cache with a time-to-live, keyed on SQL text and parameters.
+- DataSource: parameterized queries through the pool, answered from the
+  cache when the same query ran recently.
+
+Credentials come from environment variables (see `odbc_connection_string`)
+instead of being written in the scripts. Any DB-API driver works; sqlite3
+is enough for trying it out:
+
+    python -m day_02.SessionB.data_access
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    """Thread-safe pool of DB-API connections."""
+
+    def __init__(self, connect, size: int = 5, health_check: str = "SELECT 1", timeout: float | None = 30):
+        """
+        Args:
+            connect (callable): Returns a new DB-API connection.
+            size (int): Maximum number of open connections.
+            health_check (str): Query run before a pooled connection is reused;
+                                None disables the check.
+            timeout (float): Seconds to wait for a free connection (None waits forever).
+        """
+        self.connect = connect
+        self.size = size
+        self.health_check = health_check
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self.created = 0
+
+    def acquire(self):
+        """Return a healthy connection, reusing an idle one when possible."""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"no free connection after {self.timeout}s")
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if self._is_healthy(conn):
+                    return conn
+                self._close(conn)
+            self.created += 1
+            return self.connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn, discard: bool = False):
+        """Give a connection back to the pool (or close it when `discard`)."""
+        if discard:
+            self._close(conn)
+        else:
+            self._idle.put(conn)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for a `with` block; broken connections are discarded."""
+        conn = self.acquire()
+        discard = True
+        try:
+            yield conn
+            discard = False
+        finally:
+            # also on KeyboardInterrupt / GeneratorExit, so the pool never loses a slot
+            self.release(conn, discard=discard)
+
+    def close_all(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def _is_healthy(self, conn) -> bool:
+        if self.health_check is None:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute(self.health_check)
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class QueryCache:
+    """LRU cache of query results with a time-to-live."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60):
+        """
+        Args:
+            maxsize (int): Maximum number of cached results.
+            ttl (float): Seconds a result stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, rows)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(sql: str, params=()) -> tuple:
+        return sql, tuple(params)
+
+    def get(self, key):
+        """Return the cached rows for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, rows):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DataSource:
+    """Parameterized queries over a ConnectionPool with an optional QueryCache."""
+
+    def __init__(self, pool: ConnectionPool, cache: QueryCache | None = None):
+        self.pool = pool
+        self.cache = cache
+
+    def query(self, sql: str, params=(), use_cache: bool = True) -> list[tuple]:
+        """
+        Run a SELECT with `?` placeholders and return the rows as tuples.
+
+        Args:
+            sql (str): Query text, e.g. "SELECT ... WHERE ProductID = ?".
+            params (sequence): Values for the placeholders.
+            use_cache (bool): Answer from / store in the cache.
+        """
+        key = QueryCache.key(sql, params)
+        if use_cache and self.cache is not None:
+            rows = self.cache.get(key)
+            if rows is not None:
+                return list(rows)
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, tuple(params))
+            rows = [tuple(row) for row in cursor.fetchall()]
+            cursor.close()
+        if use_cache and self.cache is not None:
+            # a tuple, so callers changing their result cannot change later cache hits
+            self.cache.put(key, tuple(rows))
+        return rows
+
+    def execute(self, sql: str, params=()) -> int:
+        """Run a statement that changes data, commit, and clear the cache."""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, tuple(params))
+            rowcount = cursor.rowcount
+            cursor.close()
+            conn.commit()
+        if self.cache is not None:
+            self.cache.clear()
+        return rowcount
+
+
+def odbc_connection_string(database: str, driver: str = "ODBC Driver 18 for SQL Server") -> str:
+    """
+    Build a SQL Server connection string from environment variables:
+    BI_DB_SERVER (default localhost), BI_DB_UID and BI_DB_PWD.
+    """
+    return (
+        f"DRIVER={{{os.environ.get('BI_DB_DRIVER', driver)}}};"
+        f"SERVER={os.environ.get('BI_DB_SERVER', 'localhost')};"
+        f"DATABASE={database};"
+        f"UID={os.environ.get('BI_DB_UID', '')};"
+        f"PWD={os.environ.get('BI_DB_PWD', '')};"
+        "TrustServerCertificate=yes;"
+    )
+
+
+def odbc_data_source(database: str, size: int = 5, ttl: float = 60, **kwargs) -> DataSource:
+    """Return a pooled, cached DataSource for a SQL Server database via pyodbc."""
+    import pyodbc
+
+    conn_str = odbc_connection_string(database, **kwargs)
+    return DataSource(ConnectionPool(lambda: pyodbc.connect(conn_str), size=size), QueryCache(ttl=ttl))
+
+
+if __name__ == "__main__":
+    def connect():
+        return sqlite3.connect("file:demo?mode=memory&cache=shared", uri=True, check_same_thread=False)
+
+    keeper = connect()  # keeps the shared in-memory database alive
+    keeper.execute("CREATE TABLE Sales (Product TEXT, Revenue REAL, Cost REAL)")
+    keeper.executemany("INSERT INTO Sales VALUES (?, ?, ?)",
+                       [("Laptop", 1200, 800), ("Tablet", 500, 300), ("Phone", 800, 700)])
+    keeper.commit()
+
+    source = DataSource(ConnectionPool(connect, size=2), QueryCache(ttl=30))
+    sql = "SELECT Product, Revenue - Cost FROM Sales WHERE Revenue > ?"
+    for _ in range(3):
+        print(source.query(sql, (600,)))
+    print("Cache hits/misses:", source.cache.hits, source.cache.misses)
+    print("Connections created:", source.pool.created)
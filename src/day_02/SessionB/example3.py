@@ -1,11 +1,29 @@
 import xml.etree.ElementTree as ET
 
+from day_02.SessionA.incremental import IncrementalSalesAnalytics
+
 class XMLSalesAnalytics:
-    """Business Intelligence class to analyze sales data from XML."""
+    """Business Intelligence class to analyze sales data from XML.
+
+    With stream=True the file is read with iterparse: each <Sale> is folded
+    into running aggregates and then cleared, so memory does not grow with
+    the file size. The rows are not kept (sales_data is None); only each
+    product's last sale is remembered, so profit_margins() gives the same
+    result in both modes. overall_profit_margins() gives the margin of each
+    product's summed revenue and cost instead.
+    """
 
-    def __init__(self, xml_file):
+    def __init__(self, xml_file, stream=False):
         self.xml_file = xml_file
-        self.sales_data = self.load_xml()
+        if stream:
+            self.sales_data = None
+            self.aggregates = IncrementalSalesAnalytics()
+            self.last_sales = {}  # product -> (revenue, cost) of its last sale
+            self.aggregates.extend(self._remember_last(self.iter_sales()))
+        else:
+            self.sales_data = self.load_xml()
+            self.aggregates = None
+            self.last_sales = None
 
     def load_xml(self)-> list:
         """Parse XML and return list of sales dictionaries."""
@@ -20,21 +38,65 @@ class XMLSalesAnalytics:
             })
         return sales
 
+    def iter_sales(self):
+        """Yield sales dictionaries one <Sale> at a time, clearing parsed elements."""
+        depth = 0
+        root = None
+        for event, elem in ET.iterparse(self.xml_file, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            # only direct children of the root, like root.findall('Sale')
+            if depth == 1 and elem.tag == "Sale":
+                yield {
+                    "Product": elem.find('Product').text,
+                    "Revenue": float(elem.find('Revenue').text),
+                    "Cost": float(elem.find('Cost').text)
+                }
+            if depth == 1:
+                root.clear()
+
+    def _remember_last(self, sales):
+        for sale in sales:
+            self.last_sales[sale["Product"]] = (sale["Revenue"], sale["Cost"])
+            yield sale
+
     def total_revenue(self):
+        if self.aggregates is not None:
+            return self.aggregates.total_revenue()
         return sum(item["Revenue"] for item in self.sales_data)
 
     def total_profit(self):
+        if self.aggregates is not None:
+            return self.aggregates.total_profit()
         return sum(item["Revenue"] - item["Cost"] for item in self.sales_data)
 
     def best_product(self):
+        if self.aggregates is not None:
+            return self.aggregates.best_product()
         return max(self.sales_data, key=lambda x: x["Revenue"])["Product"]
 
     def profit_margins(self):
+        """Profit margin % of each product's last sale."""
+        if self.aggregates is not None:
+            return {
+                product: round((revenue - cost) / revenue * 100, 2)
+                for product, (revenue, cost) in self.last_sales.items()
+            }
         return {
             item["Product"]: round((item["Revenue"] - item["Cost"]) / item["Revenue"] * 100, 2)
             for item in self.sales_data
         }
 
+    def overall_profit_margins(self):
+        """Profit margin % of each product over all of its sales."""
+        if self.aggregates is not None:
+            return self.aggregates.profit_margins()
+        return IncrementalSalesAnalytics(self.sales_data).profit_margins()
+
     def low_margin_products(self, threshold=20):
         margins = self.profit_margins()
         return [product for product, margin in margins.items() if margin < threshold]
@@ -48,3 +110,6 @@ if __name__ == "__main__":
     print("Best Product by Revenue:", analytics.best_product())
     print("Profit Margins (%):", analytics.profit_margins())
     print("Low Margin Products (<20%):", analytics.low_margin_products())
+
+    streamed = XMLSalesAnalytics("data/sales.xml", stream=True)
+    print("Total Revenue (streamed):", streamed.total_revenue())
@@ -0,0 +1,158 @@
+"""
+Streaming extractor for the Northwind order lines.
+
+Instead of cursor.fetchall() and one dict per row, rows are fetched with
+cursor.fetchmany(batch_size) and turned into typed NumPy columns. Each
+batch is aggregated as soon as it arrives, so memory is bounded by the
+batch size. With prefetch > 0 a background thread keeps fetching the next
+batches while the current one is aggregated, overlapping network wait with
+compute (pyodbc releases the GIL while waiting on the server).
+
+Works with any DB-API cursor: pyodbc for SQL Server, or sqlite3 with the
+stand-in schema from `create_sqlite_northwind`.
+
+    python -m day_02.SessionB.northwind_stream
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import closing
+
+import numpy as np
+
+from day_02.SessionA.incremental import IncrementalSalesAnalytics
+
+ORDER_LINES_SQL = """
+    SELECT od.ProductID, p.ProductName, od.UnitPrice, od.Quantity
+    FROM [Order Details] od
+    JOIN Products p ON od.ProductID = p.ProductID
+"""
+COST_RATIO = 0.6  # Assume 60% cost
+
+
+def to_columns(rows) -> dict:
+    """Convert a list of (ProductID, ProductName, UnitPrice, Quantity) rows into NumPy columns."""
+    n = len(rows)
+    unit_price = np.fromiter((float(row[2]) for row in rows), dtype=np.float64, count=n)
+    quantity = np.fromiter((row[3] for row in rows), dtype=np.int64, count=n)
+    revenue = unit_price * quantity
+    return {
+        "ProductID": np.fromiter((row[0] for row in rows), dtype=np.int64, count=n),
+        "ProductName": np.array([row[1] for row in rows], dtype=object),
+        "UnitPrice": unit_price,
+        "Quantity": quantity,
+        "Revenue": revenue,
+        "Cost": revenue * COST_RATIO,
+    }
+
+
+def iter_batches(cursor, batch_size: int = 10_000):
+    """Yield column batches from an executed cursor using fetchmany."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield to_columns(rows)
+
+
+def prefetch(batches, depth: int = 2):
+    """Run the `batches` iterator in a background thread, keeping up to `depth` batches ready."""
+    buffer = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        """Wait for room in the buffer; False once the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producer():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+        except BaseException as exc:  # re-raised in the consumer thread
+            put(exc)
+            return
+        put(done)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # consumer finished, failed or stopped early (break / close): release the producer and
+        # wait for it, so the cursor is no longer in use when the caller closes it
+        stop.set()
+        thread.join()
+
+
+def stream_sales_analytics(cursor, batch_size: int = 10_000, prefetch_batches: int = 2) -> IncrementalSalesAnalytics:
+    """
+    Run the order-lines query and aggregate it batch by batch.
+
+    Args:
+        cursor: DB-API cursor (pyodbc or sqlite3).
+        batch_size (int): Rows per fetchmany call.
+        prefetch_batches (int): Batches fetched ahead in a background thread;
+                                0 fetches in the calling thread.
+
+    Returns:
+        IncrementalSalesAnalytics: Totals, best product and per-product margins.
+    """
+    cursor.execute(ORDER_LINES_SQL)
+    batches = iter_batches(cursor, batch_size)
+    if prefetch_batches:
+        batches = prefetch(batches, prefetch_batches)
+    analytics = IncrementalSalesAnalytics()
+    # closing() stops and joins the prefetch thread even when aggregation fails
+    with closing(batches):
+        for batch in batches:
+            analytics.add_columns(batch["ProductName"], batch["Revenue"], batch["Cost"])
+    return analytics
+
+
+def create_sqlite_northwind(conn, order_lines: int = 2155, seed: int = 42):
+    """Create a minimal Products / [Order Details] stand-in with random order lines."""
+    rng = np.random.default_rng(seed)
+    products = ["Chai", "Chang", "Aniseed Syrup", "Tofu", "Ikura", "Konbu", "Pavlova", "Geitost"]
+    conn.execute("CREATE TABLE Products (ProductID INTEGER PRIMARY KEY, ProductName TEXT)")
+    conn.execute(
+        "CREATE TABLE [Order Details] (OrderID INTEGER, ProductID INTEGER, "
+        "UnitPrice NUMERIC, Quantity INTEGER, Discount REAL)"
+    )
+    conn.executemany("INSERT INTO Products VALUES (?, ?)", list(enumerate(products, start=1)))
+    conn.executemany(
+        "INSERT INTO [Order Details] VALUES (?, ?, ?, ?, 0)",
+        [
+            (10248 + i // 3, int(rng.integers(1, len(products) + 1)),
+             round(float(rng.uniform(2.5, 60)), 2), int(rng.integers(1, 120)))
+            for i in range(order_lines)
+        ],
+    )
+    conn.commit()
+
+
+if __name__ == "__main__":
+    # check_same_thread=False: the prefetch thread uses the cursor
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    create_sqlite_northwind(conn)
+    analytics = stream_sales_analytics(conn.cursor(), batch_size=500)
+    conn.close()
+
+    print("Total Revenue:", analytics.total_revenue())
+    print("Total Profit:", analytics.total_profit())
+    print("Best Product by Revenue:", analytics.best_product())
+    print("Profit Margins (%):", analytics.profit_margins())
@@ -0,0 +1,237 @@
+"""
+Parallel sharded loader for large CSV and XML sales files.
+
+The file is split into byte ranges that start on a record boundary (a new
+line for CSV, a <Sale> start tag for XML). Each range is parsed in its own
+process and the partial results are combined in file order:
+
+- load_csv / load_xml return exactly the rows the serial csv.DictReader /
+  XMLSalesAnalytics.load_xml loops return, in the same order.
+- aggregate_csv / aggregate_xml return merged IncrementalSalesAnalytics
+  partials, so only small aggregates travel between processes. Totals can
+  differ from a serial loop in the last floating-point digit because the
+  additions are grouped per shard. XML ranges are fed to an XMLPullParser
+  block by block and every <Sale> is folded into the partial and cleared,
+  so a worker's memory does not grow with the size of its range.
+
+Assumptions: CSV fields do not contain quoted new lines, and <Sale>
+elements are direct children of the root and not nested in each other.
+
+    python -m day_02.SessionB.sharded_loader data/daily_sales_data.csv
+"""
+
+import csv
+import io
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+from day_02.SessionA.incremental import IncrementalSalesAnalytics
+
+SALE_START = re.compile(rb"<Sale[\s/>]")
+ROOT_START = re.compile(rb"<(?![?!])[^>]*>")
+XML_ENCODING = re.compile(rb"""<\?xml[^>]*?encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+BLOCK_SIZE = 1 << 16
+
+
+# -------------------------------
+# Shard boundaries
+# -------------------------------
+def _next_line(f, pos, end):
+    """Return the offset of the first line that starts at or after `pos`."""
+    f.seek(pos - 1)
+    f.readline()
+    return min(f.tell(), end)
+
+
+def _next_sale(f, pos, end):
+    """Return the offset of the first <Sale> start tag at or after `pos`."""
+    f.seek(pos)
+    while pos < end:
+        block = f.read(min(BLOCK_SIZE, end - pos) + 6)
+        match = SALE_START.search(block)
+        if match:
+            return min(pos + match.start(), end)
+        pos += BLOCK_SIZE
+        f.seek(pos)
+    return end
+
+
+def shard_ranges(path, start, end, shards, find_boundary=_next_line) -> list[tuple[int, int]]:
+    """Split [start, end) into at most `shards` byte ranges aligned on record boundaries."""
+    bounds = [start]
+    with open(path, "rb") as f:
+        for i in range(1, shards):
+            pos = start + (end - start) * i // shards
+            if pos <= bounds[-1]:
+                continue
+            boundary = find_boundary(f, pos, end)
+            if bounds[-1] < boundary < end:
+                bounds.append(boundary)
+    bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_range(path, start, end) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _run(worker, path, ranges, workers, *args):
+    """Run `worker(path, start, end, *args)` for every range and return results in order."""
+    if workers == 1 or len(ranges) == 1:
+        return [worker(path, start, end, *args) for start, end in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(worker, path, start, end, *args) for start, end in ranges]
+        return [future.result() for future in futures]
+
+
+# -------------------------------
+# CSV
+# -------------------------------
+def _csv_layout(path, encoding):
+    """Return (fieldnames, offset of the first data row, file size)."""
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+    fieldnames = next(csv.reader([header.decode(encoding)]))
+    return fieldnames, data_start, os.path.getsize(path)
+
+
+def _csv_rows(path, start, end, fieldnames, encoding):
+    text = _read_range(path, start, end).decode(encoding)
+    return list(csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames))
+
+
+def _csv_aggregate(path, start, end, fieldnames, encoding):
+    analytics = IncrementalSalesAnalytics()
+    for row in _csv_rows(path, start, end, fieldnames, encoding):
+        analytics.add({"Product": row["Product"], "Revenue": float(row["Revenue"]), "Cost": float(row["Cost"])})
+    return analytics
+
+
+def load_csv(path, workers=None, encoding="utf-8") -> list[dict]:
+    """Parse a CSV file in parallel; same rows as csv.DictReader, in file order."""
+    workers = workers or os.cpu_count()
+    fieldnames, data_start, size = _csv_layout(path, encoding)
+    ranges = shard_ranges(path, data_start, size, workers)
+    rows = []
+    for part in _run(_csv_rows, path, ranges, workers, fieldnames, encoding):
+        rows.extend(part)
+    return rows
+
+
+def aggregate_csv(path, workers=None, encoding="utf-8") -> IncrementalSalesAnalytics:
+    """Aggregate a Product/Revenue/Cost CSV file in parallel."""
+    workers = workers or os.cpu_count()
+    fieldnames, data_start, size = _csv_layout(path, encoding)
+    ranges = shard_ranges(path, data_start, size, workers)
+    analytics = IncrementalSalesAnalytics()
+    for part in _run(_csv_aggregate, path, ranges, workers, fieldnames, encoding):
+        analytics.merge(part)
+    return analytics
+
+
+# -------------------------------
+# XML
+# -------------------------------
+def _xml_layout(path):
+    """Return the byte range between the root start and end tags, and the declared encoding."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        head = f.read(BLOCK_SIZE)
+        f.seek(max(0, size - BLOCK_SIZE))
+        tail = f.read()
+    root = ROOT_START.search(head)
+    if root is None:
+        raise ValueError(f"{path}: no root element")
+    declaration = XML_ENCODING.match(head.removeprefix(b"\xef\xbb\xbf"))
+    encoding = declaration.group(1).decode("ascii") if declaration else "utf-8"
+    return root.end(), size - len(tail) + tail.rfind(b"</"), encoding
+
+
+def _iter_xml_range(path, start, end, encoding="utf-8"):
+    """Yield the sales of one byte range, parsed incrementally so memory does not grow with the range."""
+    parser = ET.XMLPullParser(events=("start", "end"))
+    # a shard has no prolog of its own: re-declare the file's encoding
+    parser.feed(f'<?xml version="1.0" encoding="{encoding}"?><Shard>'.encode("ascii"))
+    depth = 0
+    shard = None
+
+    def parsed_sales():
+        nonlocal depth, shard
+        for event, elem in parser.read_events():
+            if event == "start":
+                if shard is None:
+                    shard = elem
+                depth += 1
+                continue
+            depth -= 1
+            # only direct children of the shard (the file's root), like root.findall('Sale')
+            if depth == 1 and elem.tag == "Sale":
+                yield {
+                    "Product": elem.find('Product').text,
+                    "Revenue": float(elem.find('Revenue').text),
+                    "Cost": float(elem.find('Cost').text)
+                }
+            if depth == 1:
+                shard.clear()
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            parser.feed(block)
+            yield from parsed_sales()
+    parser.feed(b"</Shard>")
+    parser.close()
+    yield from parsed_sales()
+
+
+def _xml_rows(path, start, end, encoding="utf-8"):
+    return list(_iter_xml_range(path, start, end, encoding))
+
+
+def _xml_aggregate(path, start, end, encoding="utf-8"):
+    analytics = IncrementalSalesAnalytics()
+    analytics.extend(_iter_xml_range(path, start, end, encoding))
+    return analytics
+
+
+def load_xml(path, workers=None) -> list[dict]:
+    """Parse a <SalesData> XML file in parallel; same rows as XMLSalesAnalytics.load_xml."""
+    workers = workers or os.cpu_count()
+    start, end, encoding = _xml_layout(path)
+    ranges = shard_ranges(path, start, end, workers, _next_sale)
+    rows = []
+    for part in _run(_xml_rows, path, ranges, workers, encoding):
+        rows.extend(part)
+    return rows
+
+
+def aggregate_xml(path, workers=None) -> IncrementalSalesAnalytics:
+    """Aggregate a <SalesData> XML file in parallel."""
+    workers = workers or os.cpu_count()
+    start, end, encoding = _xml_layout(path)
+    ranges = shard_ranges(path, start, end, workers, _next_sale)
+    analytics = IncrementalSalesAnalytics()
+    for part in _run(_xml_aggregate, path, ranges, workers, encoding):
+        analytics.merge(part)
+    return analytics
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "data/sales.csv"
+    if path.endswith(".xml"):
+        rows = load_xml(path)
+    else:
+        rows = load_csv(path)
+    print(f"{len(rows):,} rows loaded from {path}")
+    print(rows[:3])
@@ -0,0 +1,79 @@
+"""
+black_scholes.py -
+
+Broadcasting Black-Scholes pricer: price and Greeks for whole grids at once.
+
+All inputs may be scalars or arrays of any broadcastable shapes (e.g.
+strikes[:, None, None], maturities[None, :, None], vols[None, None, :]),
+and price, Delta, Gamma, Vega, Theta and Rho come out of one call. d1, d2,
+the normal pdf of d1 and the normal cdfs are evaluated once and shared by
+all outputs (scipy.special.ndtr is the plain normal cdf, without the
+overhead of scipy.stats.norm).
+
+    python src/day_07/black_scholes.py
+"""
+
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+INV_SQRT_2PI = 1 / math.sqrt(2 * math.pi)
+
+
+def black_scholes(S, K, T, r, sigma, option="call"):
+    """
+    European option price and Greeks (no dividends).
+
+    Args:
+        S, K, T, r, sigma: Spot, strike, maturity in years, risk-free rate
+                           and volatility; scalars or broadcastable arrays.
+        option (str): 'call' or 'put'.
+
+    Returns:
+        dict: 'price', 'delta', 'gamma', 'vega', 'theta' (per year) and
+              'rho', each with the broadcast shape of the inputs.
+    """
+    S, K, T, r, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma))
+    sqrt_t = np.sqrt(T)
+    vol_t = sigma * sqrt_t
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / vol_t
+    d2 = d1 - vol_t
+    pdf = np.exp(-0.5 * d1 ** 2) * INV_SQRT_2PI
+    discounted_k = K * np.exp(-r * T)
+    time_decay = -S * pdf * sigma / (2 * sqrt_t)
+
+    if option == "call":
+        n1, n2 = ndtr(d1), ndtr(d2)
+        price = S * n1 - discounted_k * n2
+        delta = n1
+        theta = time_decay - r * discounted_k * n2
+        rho = T * discounted_k * n2
+    elif option == "put":
+        n1, n2 = ndtr(-d1), ndtr(-d2)
+        price = discounted_k * n2 - S * n1
+        delta = -n1
+        theta = time_decay + r * discounted_k * n2
+        rho = -T * discounted_k * n2
+    else:
+        raise ValueError(f"option must be 'call' or 'put', not {option!r}")
+
+    return {
+        "price": price,
+        "delta": delta,
+        "gamma": pdf / (S * vol_t),
+        "vega": S * pdf * sqrt_t,
+        "theta": theta,
+        "rho": rho,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    strikes = np.linspace(50, 150, 1000)[:, None, None]
+    maturities = np.linspace(0.05, 5, 100)[None, :, None]
+    vols = np.linspace(0.05, 0.8, 100)[None, None, :]
+    start = time.perf_counter()
+    surface = black_scholes(100.0, strikes, maturities, 0.05, vols)
+    print(f"{surface['price'].size:,} grid points (price + 5 Greeks) in {time.perf_counter() - start:.2f}s")
@@ -8,6 +8,9 @@ This script implements the Black–Scholes model, Monte Carlo simulation, and co
 
 import numpy as np
 
+from black_scholes import black_scholes
+from mc_pricer import price_european_call
+
 # --- Step 1: Parameters ---
 S0 = 100.0      # initial stock price
 K = 105.0       # strike price
@@ -26,23 +29,17 @@ C0_MC = np.exp(-r * T) * np.mean(payoffs)
 print(f"Monte Carlo European Call Price: {C0_MC:.4f}")
 
 # --- Step 3: Analytical Black–Scholes formula for comparison ---
-from scipy.stats import norm
-
-def black_scholes_call(S, K, T, r, sigma):
-    d1 = (np.log(S/K) + (r + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
-    d2 = d1 - sigma*np.sqrt(T)
-    call_price = S*norm.cdf(d1) - K*np.exp(-r*T)*norm.cdf(d2)
-    return call_price, d1, d2
-
-C0_BS, d1, d2 = black_scholes_call(S0, K, T, r, sigma)
+# price and all Greeks from one broadcasting call, see black_scholes.py
+bs = black_scholes(S0, K, T, r, sigma)
+C0_BS = bs["price"]
 print(f"Black–Scholes Analytical Price: {C0_BS:.4f}")
 
 # --- Step 4: Compute Greeks using NumPy (vectorized) ---
-Delta = norm.cdf(d1)
-Gamma = norm.pdf(d1) / (S0 * sigma * np.sqrt(T))
-Vega = S0 * norm.pdf(d1) * np.sqrt(T)
-Theta = -(S0 * norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) - r*K*np.exp(-r*T)*norm.cdf(d2)
-Rho = K*T*np.exp(-r*T)*norm.cdf(d2)
+Delta = bs["delta"]
+Gamma = bs["gamma"]
+Vega = bs["vega"]
+Theta = bs["theta"]
+Rho = bs["rho"]
 
 print("\nOption Greeks:")
 print(f"  Delta: {Delta:.4f}")
@@ -53,23 +50,18 @@ print(f"  Rho  : {Rho:.4f}")
 
 # --- Step 5: Stress testing (sensitivity to volatility and rate) ---
 vol_range = np.linspace(0.05, 0.6, 12)
-price_vs_vol = np.array([black_scholes_call(S0, K, T, r, vol)[0] for vol in vol_range])
+price_vs_vol = black_scholes(S0, K, T, r, vol_range)["price"]
 
 rate_range = np.linspace(0.0, 0.1, 12)
-price_vs_rate = np.array([black_scholes_call(S0, K, T, rate, sigma)[0] for rate in rate_range])
+price_vs_rate = black_scholes(S0, K, T, rate_range, sigma)["price"]
 
 # --- Step 6: Monte Carlo Delta estimation (finite difference) ---
+# streamed in chunks with common random numbers, see mc_pricer.py
+# (n_workers=1: this script has no __main__ guard to start worker processes from)
 eps = 0.01
-S_up = S0 + eps
-S_down = S0 - eps
-
-ST_up = S_up * np.exp((r - 0.5 * sigma**2) * T + sigma * np.sqrt(T) * Z)
-ST_down = S_down * np.exp((r - 0.5 * sigma**2) * T + sigma * np.sqrt(T) * Z)
-payoffs_up = np.maximum(ST_up - K, 0)
-payoffs_down = np.maximum(ST_down - K, 0)
-
-Delta_MC = np.exp(-r*T) * (np.mean(payoffs_up - payoffs_down)) / (2*eps)
-print(f"\nMonte Carlo Delta Estimate: {Delta_MC:.4f}")
+mc = price_european_call(S0, K, T, r, sigma, n_sim=n_sim, n_workers=1, seed=42, eps=eps)
+Delta_MC = mc["delta"]
+print(f"\nMonte Carlo Delta Estimate: {Delta_MC:.4f} (95% CI {mc['delta_ci'][0]:.4f} - {mc['delta_ci'][1]:.4f})")
 
 # --- Step 7: Risk Simulation: P&L distribution at maturity ---
 positions = 1000   # number of options held
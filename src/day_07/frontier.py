@@ -0,0 +1,79 @@
+"""
+frontier.py -
+
+Batched random-portfolio efficient frontier for ex1,py.
+
+Instead of one return / volatility evaluation per random weight vector, a
+whole chunk of weight vectors is drawn at once: returns come from one
+matrix-vector product and variances from einsum('ij,jk,ik->i'). Chunks
+keep memory bounded (chunk x assets) for 10^6 portfolios over hundreds of
+assets, and only the best portfolio's weights are kept.
+
+With the default rng (NumPy's global legacy generator) the weights are
+drawn in exactly the order of ex1's loop, so np.random.seed(42) gives the
+same frontier.
+"""
+
+import numpy as np
+
+
+def random_frontier(mean_returns, cov_matrix, num_portfolios=10_000, rng=None, risk_free=0.0,
+                    max_chunk_elements=2_000_000):
+    """
+    Evaluate random long-only portfolios (weights uniform, normalised to 1).
+
+    Args:
+        mean_returns (array-like): Expected return of every asset (n,).
+        cov_matrix (array-like): Covariance matrix of the assets (n, n).
+        num_portfolios (int): Number of random portfolios.
+        rng: np.random.Generator, or None for the global np.random state.
+        risk_free (float): Risk-free rate subtracted in the Sharpe ratio.
+        max_chunk_elements (int): Weight-matrix elements per chunk (memory bound).
+
+    Returns:
+        dict: 'results' (3 x num_portfolios: return, volatility, Sharpe,
+              the layout of ex1's loop), 'max_sharpe_idx', 'max_sharpe_weights'
+              and 'max_sharpe' (return, volatility, Sharpe of the best portfolio).
+    """
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    rng = np.random if rng is None else rng
+    n = len(mean_returns)
+    chunk = max(1, max_chunk_elements // n)
+
+    results = np.zeros((3, num_portfolios))
+    best_idx, best_weights = -1, None
+    for start in range(0, num_portfolios, chunk):
+        stop = min(start + chunk, num_portfolios)
+        weights = rng.random((stop - start, n))
+        weights /= weights.sum(axis=1, keepdims=True)
+        ret = weights @ mean_returns
+        vol = np.sqrt(np.einsum("ij,jk,ik->i", weights, cov_matrix, weights, optimize=True))
+        sharpe = (ret - risk_free) / vol
+        results[0, start:stop] = ret
+        results[1, start:stop] = vol
+        results[2, start:stop] = sharpe
+        i = int(np.argmax(sharpe))
+        if best_idx < 0 or sharpe[i] > results[2, best_idx]:
+            best_idx, best_weights = start + i, weights[i].copy()
+
+    return {
+        "results": results,
+        "max_sharpe_idx": best_idx,
+        "max_sharpe_weights": best_weights,
+        "max_sharpe": tuple(results[:, best_idx]) if best_idx >= 0 else None,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n_assets = 500
+    factors = rng.normal(0, 0.01, size=(n_assets, 20))
+    cov = factors @ factors.T + np.diag(rng.uniform(1e-5, 1e-4, n_assets))
+    mu = rng.normal(0.0005, 0.0003, n_assets)
+    start = time.perf_counter()
+    frontier = random_frontier(mu, cov, 1_000_000, rng=rng)
+    print(f"1,000,000 portfolios x {n_assets} assets in {time.perf_counter() - start:.1f}s,"
+          f" best Sharpe {frontier['max_sharpe'][2]:.4f}")
@@ -0,0 +1,193 @@
+"""
+gbm.py -
+
+Chunked geometric Brownian motion simulation with streaming statistics.
+
+ex1,py builds the whole (simulations x T) matrix of growth factors and a
+cumprod copy of it, only to read the last column. Here paths are simulated
+a chunk at a time: the log-returns of a chunk are drawn, scaled and summed
+in place, and only the final values are folded into running statistics
+(mean, standard deviation, probability of loss) and a DDSketch, a
+mergeable quantile sketch with bounded relative error. Memory is O(chunk),
+whatever the number of paths; a few full paths can be kept for plotting.
+
+With the default rng (NumPy's global legacy generator) the random numbers
+are drawn in the same order as np.random.randn(simulations, T) in ex1,py.
+"""
+
+import math
+
+import numpy as np
+
+
+class DDSketch:
+    """
+    Quantile sketch with relative accuracy `relative_accuracy` (Masson et al., 2019).
+
+    Values are counted in logarithmic buckets; any quantile is returned
+    within the relative error, and sketches of different streams merge by
+    adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = {}   # bucket index -> count
+        self.negative = {}   # bucket index of |value| -> count
+        self.zero_count = 0
+        self.count = 0
+
+    def _add_to(self, store, magnitudes):
+        keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def add(self, values):
+        """Add an array of values."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self._add_to(self.positive, values[values > 0])
+        self._add_to(self.negative, -values[values < 0])
+        self.zero_count += int(np.count_nonzero(values == 0))
+        self.count += len(values)
+        return self
+
+    def merge(self, other):
+        """Add the counts of a sketch with the same relative accuracy."""
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same relative accuracy can be merged")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def _value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        """Approximate q-quantile (0 <= q <= 1); NaN for an empty sketch."""
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+
+class FinalValueStats:
+    """Running count, mean, variance, loss count and quantile sketch of final values."""
+
+    def __init__(self, initial_value, relative_accuracy=0.01):
+        self.initial_value = initial_value
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.losses = 0
+        self.sketch = DDSketch(relative_accuracy)
+
+    def add(self, values):
+        """Fold a chunk of final values into the statistics."""
+        n_b = len(values)
+        if n_b == 0:
+            return self
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        self._combine(n_b, mean_b, m2_b)
+        self.losses += int(np.count_nonzero(values < self.initial_value))
+        self.sketch.add(values)
+        return self
+
+    def merge(self, other):
+        """Combine with the statistics of another simulation (e.g. from another worker)."""
+        if other.n:
+            self._combine(other.n, other.mean, other._m2)
+            self.losses += other.losses
+            self.sketch.merge(other.sketch)
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b):
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    @property
+    def std(self):
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    @property
+    def loss_probability(self):
+        return self.losses / self.n if self.n else math.nan
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+
+def simulate_gbm(initial_value, mu, sigma, T=252, simulations=10_000, dt=None, rng=None, keep_paths=0,
+                 max_chunk_elements=1_000_000, relative_accuracy=0.01):
+    """
+    Simulate GBM paths chunk by chunk and summarise their final values.
+
+    Args:
+        initial_value (float): Starting value of every path.
+        mu (float): Annual drift.
+        sigma (float): Annual volatility.
+        T (int): Number of steps.
+        simulations (int): Number of paths.
+        dt (float): Step length in years (default 1 / T, as in ex1,py).
+        rng: np.random.Generator, or None for the global np.random state.
+        keep_paths (int): Number of full paths (the first ones) to keep for plotting.
+        max_chunk_elements (int): Random numbers drawn per chunk (memory bound).
+        relative_accuracy (float): Relative accuracy of the quantile sketch.
+
+    Returns:
+        dict: 'stats' (FinalValueStats) and 'paths' (keep_paths x T values).
+    """
+    dt = 1 / T if dt is None else dt
+    rng = np.random if rng is None else rng
+    drift = (mu - 0.5 * sigma ** 2) * dt
+    scale = sigma * math.sqrt(dt)
+    chunk = max(1, max_chunk_elements // T)
+
+    stats = FinalValueStats(initial_value, relative_accuracy)
+    paths = []
+    for start in range(0, simulations, chunk):
+        log_returns = rng.standard_normal((min(chunk, simulations - start), T))
+        log_returns *= scale
+        log_returns += drift
+        if start < keep_paths:
+            kept = log_returns[:keep_paths - start]
+            paths.append(initial_value * np.exp(np.cumsum(kept, axis=1)))
+        final_values = log_returns.sum(axis=1)
+        np.exp(final_values, out=final_values)
+        final_values *= initial_value
+        stats.add(final_values)
+    return {"stats": stats, "paths": np.concatenate(paths) if paths else np.empty((0, T))}
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = simulate_gbm(1_000_000, 0.08, 0.2, T=252 * 5, simulations=1_000_000, dt=1 / 252,
+                          rng=np.random.default_rng(42), keep_paths=20)
+    stats = result["stats"]
+    peak = tracemalloc.get_traced_memory()[1]
+    print(f"1,000,000 paths x 1260 steps in {time.perf_counter() - start:.1f}s, peak memory {peak / 1e6:.0f} MB")
+    print(f"  mean {stats.mean:,.0f}  std {stats.std:,.0f}  P(loss) {stats.loss_probability:.2%}")
+    print(f"  5% {stats.quantile(0.05):,.0f}  median {stats.quantile(0.5):,.0f}  95% {stats.quantile(0.95):,.0f}")
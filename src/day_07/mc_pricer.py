@@ -0,0 +1,133 @@
+"""
+mc_pricer.py -
+
+Multi-core Monte Carlo pricing of a European call, with Delta and error bars.
+
+Simulations are split across a process pool. Every worker gets its own
+random stream from SeedSequence(seed).spawn(), so results are reproducible
+for a given seed and number of workers, and the streams never overlap.
+Workers simulate in chunks and return only running sums (count, sum and
+sum of squares of the discounted payoff and of the Delta estimate), so
+memory stays O(chunk) per worker.
+
+Delta uses common random numbers: the bumped terminal prices are the same
+draws scaled by (S0 +/- eps) / S0, so no extra exponentials or random
+numbers are needed. With target_se the simulation runs in rounds and stops
+as soon as the standard error of the price is small enough.
+
+Processes are started from the caller, so use it under
+if __name__ == "__main__" (or with n_workers=1) in scripts.
+
+    python src/day_07/mc_pricer.py
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+
+def simulate_sums(S0, K, T, r, sigma, eps, n_paths, seed_seq, chunk_size=100_000):
+    """
+    Simulate n_paths terminal prices from one random stream.
+
+    Returns:
+        np.ndarray: [n, sum(payoff), sum(payoff^2), sum(delta), sum(delta^2)]
+                    of the discounted payoffs and central-difference Deltas.
+    """
+    rng = np.random.default_rng(seed_seq)
+    drift = (r - 0.5 * sigma ** 2) * T
+    vol = sigma * math.sqrt(T)
+    discount = math.exp(-r * T)
+    up, down = (S0 + eps) / S0, (S0 - eps) / S0
+    sums = np.zeros(5)
+    for start in range(0, n_paths, chunk_size):
+        n = min(chunk_size, n_paths - start)
+        ST = rng.standard_normal(n)
+        ST *= vol
+        ST += drift
+        np.exp(ST, out=ST)
+        ST *= S0
+        payoff = np.maximum(ST - K, 0) * discount
+        delta = (np.maximum(ST * up - K, 0) - np.maximum(ST * down - K, 0)) * (discount / (2 * eps))
+        sums += [n, payoff.sum(), payoff @ payoff, delta.sum(), delta @ delta]
+    return sums
+
+
+def _estimate(total, sum_x, sum_x2, z):
+    mean = sum_x / total
+    var = max(sum_x2 - total * mean * mean, 0.0) / (total - 1) if total > 1 else math.nan
+    se = math.sqrt(var / total)
+    return mean, se, (mean - z * se, mean + z * se)
+
+
+def price_european_call(S0, K, T, r, sigma, n_sim=1_000_000, n_workers=None, seed=42, eps=0.01,
+                        target_se=None, batch_size=250_000, chunk_size=100_000, level=0.95):
+    """
+    Monte Carlo price and Delta of a European call.
+
+    Args:
+        S0, K, T, r, sigma (float): Spot, strike, maturity (years), rate and volatility.
+        n_sim (int): Number of paths; with target_se, the maximum number of paths.
+        n_workers (int): Processes (default: CPU count); 1 runs in this process.
+        seed (int): Seed of the SeedSequence the worker streams are spawned from.
+        eps (float): Spot bump for the central-difference Delta.
+        target_se (float): Stop once the standard error of the price is at most this.
+        batch_size (int): Paths per worker per round when target_se is set.
+        chunk_size (int): Paths simulated at once inside a worker.
+        level (float): Confidence level of the intervals.
+
+    Returns:
+        dict: 'price', 'price_se', 'price_ci', 'delta', 'delta_se', 'delta_ci', 'n_sim'.
+    """
+    n_workers = n_workers or os.cpu_count()
+    worker_seqs = np.random.SeedSequence(seed).spawn(n_workers)
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    pool = ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+    sums = np.zeros(5)
+    try:
+        while sums[0] < n_sim:
+            remaining = int(n_sim - sums[0])
+            per_round = remaining if target_se is None else min(remaining, batch_size * n_workers)
+            sizes = [per_round // n_workers + (i < per_round % n_workers) for i in range(n_workers)]
+            # each round continues every worker's stream with a fresh child sequence
+            seqs = [ws.spawn(1)[0] for ws in worker_seqs]
+            args = [(S0, K, T, r, sigma, eps, size, seq, chunk_size) for size, seq in zip(sizes, seqs) if size]
+            if pool is None:
+                parts = [simulate_sums(*a) for a in args]
+            else:
+                parts = list(pool.map(simulate_sums, *zip(*args)))
+            sums += np.sum(parts, axis=0)
+            if target_se is not None and _estimate(sums[0], sums[1], sums[2], z)[1] <= target_se:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    price, price_se, price_ci = _estimate(sums[0], sums[1], sums[2], z)
+    delta, delta_se, delta_ci = _estimate(sums[0], sums[3], sums[4], z)
+    return {
+        "price": price, "price_se": price_se, "price_ci": price_ci,
+        "delta": delta, "delta_se": delta_se, "delta_ci": delta_ci,
+        "n_sim": int(sums[0]),
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    from scipy.stats import norm
+
+    S0, K, T, r, sigma = 100.0, 105.0, 1.0, 0.05, 0.2
+    d1 = (math.log(S0 / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
+    bs = S0 * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d1 - sigma * math.sqrt(T))
+    print(f"Black-Scholes: price {bs:.4f}, delta {norm.cdf(d1):.4f}")
+
+    for kwargs in ({"n_sim": 10_000_000}, {"n_sim": 100_000_000, "target_se": 0.002}):
+        start = time.perf_counter()
+        result = price_european_call(S0, K, T, r, sigma, **kwargs)
+        lo, hi = result["price_ci"]
+        print(f"{kwargs}: price {result['price']:.4f} [{lo:.4f}, {hi:.4f}], delta {result['delta']:.4f}"
+              f" +/- {result['delta_se']:.4f}, {result['n_sim']:,} paths in {time.perf_counter() - start:.1f}s")
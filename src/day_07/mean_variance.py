@@ -0,0 +1,296 @@
+"""
+mean_variance.py -
+
+Exact mean-variance optimisation for the inputs of ex1,py (mean_returns, cov_matrix).
+
+Fully invested portfolios (weights sum to 1):
+
+- Unconstrained (short selling allowed): closed form. The covariance is
+  Cholesky-factorised once and reused for every solve; the minimum-variance
+  portfolio, the tangency (maximum Sharpe) portfolio and every frontier
+  point are combinations of inv(cov) @ 1 and inv(cov) @ mu.
+- Long-only / box constraints (lo <= w <= hi): every frontier point is
+  solved exactly with primal-dual active set iterations (a Cholesky solve
+  on the free assets per iteration), starting from the active set of the
+  previous point, so along the frontier usually one or two solves are
+  needed. FISTA (accelerated projected gradient, with an exact projection
+  onto {sum(w) = 1, lo <= w <= hi}) is the fallback when the active set
+  does not settle. The maximum-Sharpe portfolio is refined with a
+  golden-section search on the target return.
+
+    python src/day_07/mean_variance.py
+"""
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+GOLDEN = (np.sqrt(5) - 1) / 2
+
+
+def project_capped_simplex(v, lo, hi):
+    """
+    Euclidean projection of v onto {w : sum(w) = 1, lo <= w <= hi}.
+
+    The projection is clip(v - tau, lo, hi) for the shift tau that makes the
+    weights sum to 1. The sum is piecewise linear in tau with breakpoints at
+    v - hi and v - lo, so tau is found exactly from the sorted breakpoints.
+    """
+    points = np.concatenate([v - hi, v - lo])
+    order = np.argsort(points, kind="stable")
+    points = points[order]
+    # passing v_i - hi_i starts decreasing coordinate i, passing v_i - lo_i stops it
+    slope = -np.cumsum(np.where(order < len(v), 1.0, -1.0))
+    total = hi.sum() + np.concatenate([[0.0], np.cumsum(slope[:-1] * np.diff(points))])
+    k = np.searchsorted(-total, -1.0, side="left")  # first breakpoint with total <= 1
+    if k == 0:
+        tau = points[0]
+    else:
+        tau = points[k - 1] + (1.0 - total[k - 1]) / slope[k - 1] if slope[k - 1] else points[k - 1]
+    return np.clip(v - tau, lo, hi)
+
+
+class MeanVariance:
+    """Minimum-variance, tangency and efficient-frontier portfolios for one set of inputs."""
+
+    def __init__(self, mean_returns, cov_matrix, risk_free=0.0):
+        """
+        Args:
+            mean_returns (array-like): Expected return of every asset (n,).
+            cov_matrix (array-like): Positive definite covariance matrix (n, n).
+            risk_free (float): Risk-free rate used in the Sharpe ratio.
+        """
+        self.mean_returns = np.asarray(mean_returns, dtype=np.float64)
+        self.cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+        self.risk_free = risk_free
+        self.n = len(self.mean_returns)
+        self._factor = cho_factor(self.cov_matrix)
+        self._inv_ones = cho_solve(self._factor, np.ones(self.n))
+        self._inv_mu = cho_solve(self._factor, self.mean_returns)
+        self._a = self._inv_ones.sum()                  # 1' C^-1 1
+        self._b = self._inv_mu.sum()                    # 1' C^-1 mu
+        self._c = self.mean_returns @ self._inv_mu      # mu' C^-1 mu
+        self._lipschitz = np.linalg.eigvalsh(self.cov_matrix)[-1]
+
+    def performance(self, weights):
+        """(return, volatility, Sharpe) for one weight vector or for every row of a matrix."""
+        weights = np.asarray(weights, dtype=np.float64)
+        ret = weights @ self.mean_returns
+        vol = np.sqrt(np.einsum("...j,jk,...k->...", weights, self.cov_matrix, weights))
+        return ret, vol, (ret - self.risk_free) / vol
+
+    def _bounds(self, bounds):
+        if bounds is None:
+            return None
+        lo, hi = (0.0, 1.0) if bounds == "long_only" else bounds
+        lo = np.broadcast_to(np.asarray(lo, dtype=np.float64), (self.n,))
+        hi = np.broadcast_to(np.asarray(hi, dtype=np.float64), (self.n,))
+        if lo.sum() > 1 or hi.sum() < 1 or (lo > hi).any():
+            raise ValueError("No fully invested portfolio satisfies the bounds")
+        return lo, hi
+
+    # --- unconstrained (closed form) ---
+
+    def _frontier_weights(self, targets):
+        """Minimum-variance weights for every target return (rows)."""
+        d = self._a * self._c - self._b ** 2
+        targets = np.asarray(targets, dtype=np.float64)[:, None]
+        return ((self._c - self._b * targets) * self._inv_ones + (self._a * targets - self._b) * self._inv_mu) / d
+
+    # --- box constrained (active set, FISTA as fallback) ---
+
+    def _active_set(self, q, A, b, w, lo, hi, max_iter=50):
+        """
+        Minimise 0.5 w'Cw - q'w subject to A w = b and lo <= w <= hi exactly by
+        primal-dual active set iterations, starting from the bounds that w sits
+        on. Each iteration solves the KKT system of the free assets with a
+        Cholesky factorisation. Returns None if the active set does not settle.
+        """
+        C = self.cov_matrix
+        at_lo = w <= lo + 1e-12
+        at_hi = (w >= hi - 1e-12) & ~at_lo
+        for _ in range(max_iter):
+            free = ~(at_lo | at_hi)
+            if free.sum() < len(b):
+                return None
+            w = np.where(at_lo, lo, np.where(at_hi, hi, 0.0))
+            rhs = q[free] - C[np.ix_(free, ~free)] @ w[~free]
+            factor = cho_factor(C[np.ix_(free, free)])
+            inv_rhs, inv_a = cho_solve(factor, rhs), cho_solve(factor, A[:, free].T)
+            try:
+                # multipliers of A w = b from the Schur complement A_F C_FF^-1 A_F'
+                nu = np.linalg.solve(A[:, free] @ inv_a, A[:, free] @ inv_rhs - (b - A[:, ~free] @ w[~free]))
+            except np.linalg.LinAlgError:
+                return None
+            w[free] = inv_rhs - inv_a @ nu
+            grad = C @ w - q + A.T @ nu
+            eps = 1e-12 * (np.abs(C @ w).max() + np.abs(q).max() + np.abs(A.T @ nu).max())
+            new_lo = (free & (w < lo)) | (at_lo & (grad >= -eps))
+            new_hi = ((free & (w > hi)) | (at_hi & (grad <= eps))) & ~new_lo
+            if (new_lo == at_lo).all() and (new_hi == at_hi).all():
+                return w
+            at_lo, at_hi = new_lo, new_hi
+        return None
+
+    def _fista(self, t, w0, lo, hi, tol=1e-9, max_iter=20_000):
+        """Approximately minimise 0.5 w'Cw - t mu'w over the box-constrained simplex, starting from w0."""
+        step = 1.0 / self._lipschitz
+        x = y = w0
+        theta = 1.0
+        for _ in range(max_iter):
+            x_new = project_capped_simplex(y - step * (self.cov_matrix @ y - t * self.mean_returns), lo, hi)
+            if (y - x_new) @ (x_new - x) > 0:   # adaptive restart when momentum points uphill
+                theta = 1.0
+            theta_new = (1 + np.sqrt(1 + 4 * theta ** 2)) / 2
+            y = x_new + (theta - 1) / theta_new * (x_new - x)
+            done = np.max(np.abs(x_new - x)) < tol
+            x, theta = x_new, theta_new
+            if done:
+                break
+        return x
+
+    def _solve(self, t, w0, lo, hi):
+        """Minimise 0.5 w'Cw - t mu'w over the box-constrained simplex, warm-started from w0."""
+        ones = np.ones((1, self.n))
+        w = self._active_set(t * self.mean_returns, ones, np.ones(1), w0, lo, hi)
+        if w is None:
+            w0 = self._fista(t, w0, lo, hi)
+            w = self._active_set(t * self.mean_returns, ones, np.ones(1), w0, lo, hi)
+        return w0 if w is None else w
+
+    def _solve_target(self, target, w0, lo, hi):
+        """Minimum-variance weights with return `target`, warm-started from w0."""
+        A = np.vstack([np.ones(self.n), self.mean_returns])
+        w = self._active_set(np.zeros(self.n), A, np.array([1.0, target]), w0, lo, hi)
+        if w is not None:
+            return w
+        # fallback: bisection on t along the path min 0.5 w'Cw - t mu'w, whose return grows with t
+        spread = max(np.ptp(self.mean_returns), 1e-12)
+        t_lo, t_hi, w = 0.0, self._lipschitz / spread, w0
+        for _ in range(60):
+            w = self._solve(t_hi, w, lo, hi)
+            if w @ self.mean_returns >= target:
+                break
+            t_lo, t_hi = t_hi, 2 * t_hi
+        for _ in range(60):
+            t = (t_lo + t_hi) / 2
+            w = self._solve(t, w, lo, hi)
+            if w @ self.mean_returns < target:
+                t_lo = t
+            else:
+                t_hi = t
+        return w
+
+    def _max_return(self, lo, hi):
+        """Highest-return weights within the bounds: fill the best assets up to their upper bound."""
+        w = lo.copy()
+        for i in np.argsort(-self.mean_returns):
+            w[i] = min(hi[i], lo[i] + 1 - w.sum())
+        return w
+
+    # --- public API ---
+
+    def min_variance(self, bounds=None):
+        """Weights of the minimum-variance portfolio."""
+        box = self._bounds(bounds)
+        if box is None:
+            return self._inv_ones / self._a
+        return self._solve(0.0, project_capped_simplex(np.full(self.n, 1.0 / self.n), *box), *box)
+
+    def frontier(self, n_points=50, bounds=None):
+        """
+        Efficient frontier: minimum-variance portfolios for evenly spaced target
+        returns, from the minimum-variance portfolio to the highest return
+        (max(mean_returns) when short selling is allowed).
+
+        Args:
+            n_points (int): Number of frontier portfolios.
+            bounds: None (short selling allowed), "long_only", or (lo, hi)
+                    with scalars or per-asset arrays.
+
+        Returns:
+            dict: 'weights' (n_points x n) and 'results' (3 x n_points:
+                  return, volatility, Sharpe, as in ex1,py).
+        """
+        box = self._bounds(bounds)
+        if box is None:
+            r_min = self._b / self._a
+            weights = self._frontier_weights(np.linspace(r_min, max(self.mean_returns.max(), r_min), n_points))
+        else:
+            weights = self._box_frontier(n_points, *box)
+        return {"weights": weights, "results": np.vstack(self.performance(weights))}
+
+    def _box_frontier(self, n_points, lo, hi):
+        w = self.min_variance((lo, hi))
+        top = self._max_return(lo, hi)
+        targets = np.linspace(w @ self.mean_returns, top @ self.mean_returns, n_points)
+        weights = [w]
+        for target in targets[1:-1]:
+            w = self._solve_target(target, w, lo, hi)
+            weights.append(w)
+        weights.append(top)
+        return np.array(weights[:n_points])
+
+    def tangency(self, bounds=None, n_grid=20, tol=1e-6):
+        """
+        Weights of the maximum-Sharpe (tangency) portfolio.
+
+        Unconstrained it is inv(C) (mu - rf) / 1' inv(C) (mu - rf). With
+        bounds, the Sharpe ratio (unimodal along the frontier) is scanned on
+        an n_grid-point frontier and the best bracket of target returns is
+        refined by golden-section search down to tol of the return range.
+        """
+        box = self._bounds(bounds)
+        if box is None:
+            excess = self._inv_mu - self.risk_free * self._inv_ones
+            return excess / excess.sum()
+
+        lo, hi = box
+        path = self._box_frontier(n_grid, lo, hi)
+        returns, _, sharpe = self.performance(path)
+        i = int(np.argmax(sharpe))
+        if n_grid < 3 or np.ptp(returns) <= 0:
+            return path[i]
+        a, b = returns[max(i - 1, 0)], returns[min(i + 1, n_grid - 1)]
+        w = path[i]
+
+        def evaluate(target):
+            nonlocal w
+            w = self._solve_target(target, w, lo, hi)
+            return self.performance(w)[2], w
+
+        c, d = b - GOLDEN * (b - a), a + GOLDEN * (b - a)
+        (fc, wc), (fd, wd) = evaluate(c), evaluate(d)
+        while b - a > tol * np.ptp(returns):
+            if fc > fd:
+                b, d, fd, wd = d, c, fc, wc
+                c = b - GOLDEN * (b - a)
+                fc, wc = evaluate(c)
+            else:
+                a, c, fc, wc = c, d, fd, wd
+                d = a + GOLDEN * (b - a)
+                fd, wd = evaluate(d)
+        return max([(fc, wc), (fd, wd), (sharpe[i], path[i])], key=lambda item: item[0])[1]
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n_assets = 1000
+    factors = rng.normal(0, 0.01, size=(n_assets, 20))
+    cov = factors @ factors.T + np.diag(rng.uniform(1e-5, 1e-4, n_assets))
+    mu = rng.normal(0.0005, 0.0003, n_assets)
+
+    start = time.perf_counter()
+    mv = MeanVariance(mu, cov)
+    unconstrained = mv.frontier(50)
+    w = mv.tangency()
+    print(f"Unconstrained: 50-point frontier + tangency in {time.perf_counter() - start:.2f}s,"
+          f" max Sharpe {mv.performance(w)[2]:.4f}")
+
+    start = time.perf_counter()
+    long_only = mv.frontier(50, bounds="long_only")
+    w = mv.tangency(bounds="long_only")
+    ret, vol, sharpe = mv.performance(w)
+    print(f"Long-only:     50-point frontier + tangency in {time.perf_counter() - start:.2f}s,"
+          f" max Sharpe {sharpe:.4f} with {np.sum(w > 1e-6)} assets")
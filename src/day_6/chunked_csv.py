@@ -0,0 +1,109 @@
+"""
+chunked_csv.py -
+
+Out-of-core reading of daily_sales_data.csv-style files.
+
+iter_blocks() yields fixed-size blocks of typed NumPy columns, so only one
+block is in memory at a time. MonthlyAccumulator folds each block into
+per-month partial sums (see monthly_kpis.py) and produces the same KPIs as
+reading the whole file at once.
+
+    python src/day_6/chunked_csv.py data/daily_sales_data.csv
+"""
+
+import csv
+import sys
+import time
+from itertools import islice
+
+import numpy as np
+
+from csv_cache import data_rows
+from monthly_kpis import DAILY_COLUMNS, month_codes, monthly_totals, kpis_from_totals
+
+def iter_blocks(csv_filename, block_rows=100_000, dtypes=None, encoding="utf-8-sig"):
+    """
+    Yield the CSV as blocks of at most `block_rows` rows.
+
+    Args:
+        csv_filename (str): Path of a CSV file with a header row.
+        block_rows (int): Rows per block.
+        dtypes (dict): Column -> NumPy dtype; other columns are read as str.
+                       Defaults to the daily sales schema.
+        encoding (str): File encoding; the default also strips a UTF-8 BOM.
+
+    Yields:
+        dict: Column name -> NumPy array for the rows of one block.
+    """
+    dtypes = DAILY_COLUMNS if dtypes is None else dtypes
+    with open(csv_filename, mode="r", newline="", encoding=encoding) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows_iter = data_rows(reader, len(header), csv_filename)
+        while True:
+            rows = list(islice(rows_iter, block_rows))
+            if not rows:
+                return
+            columns = zip(*rows)
+            yield {name: np.array(values, dtype=dtypes.get(name, str)) for name, values in zip(header, columns)}
+
+
+class MonthlyAccumulator:
+    """Fold blocks of daily rows into per-month sales and marketing-spend totals."""
+
+    def __init__(self):
+        self.totals = {}  # month code -> [sales, marketing_spend]
+        self.rows = 0
+
+    def add_block(self, block):
+        codes, sales, spend = monthly_totals(month_codes(block["date"]), block["sales"], block["marketing_spend"])
+        for code, s, sp in zip(codes.tolist(), sales.tolist(), spend.tolist()):
+            partial = self.totals.setdefault(code, [0.0, 0.0])
+            partial[0] += s
+            partial[1] += sp
+        self.rows += len(block["sales"])
+
+    def merge(self, other):
+        """Add the partial totals of another accumulator (e.g. from another file)."""
+        for code, (s, sp) in other.totals.items():
+            partial = self.totals.setdefault(code, [0.0, 0.0])
+            partial[0] += s
+            partial[1] += sp
+        self.rows += other.rows
+
+    def kpis(self):
+        """Monthly KPIs in the same format as monthly_kpis.monthly_kpis()."""
+        codes = sorted(self.totals)
+        return kpis_from_totals(
+            codes,
+            [self.totals[c][0] for c in codes],
+            [self.totals[c][1] for c in codes],
+        )
+
+
+def monthly_kpis_chunked(csv_filename, block_rows=100_000):
+    """
+    Compute monthly KPIs for a file of any size with bounded memory.
+
+    Returns:
+        (kpis, stats): KPI dict and {'rows', 'seconds', 'rows_per_s'}.
+    """
+    start = time.perf_counter()
+    accumulator = MonthlyAccumulator()
+    for block in iter_blocks(csv_filename, block_rows):
+        accumulator.add_block(block)
+    seconds = time.perf_counter() - start
+    stats = {
+        "rows": accumulator.rows,
+        "seconds": seconds,
+        "rows_per_s": accumulator.rows / seconds if seconds else float("inf"),
+    }
+    return accumulator.kpis(), stats
+
+
+if __name__ == "__main__":
+    csv_filename = sys.argv[1] if len(sys.argv) > 1 else "data/daily_sales_data.csv"
+    kpis, stats = monthly_kpis_chunked(csv_filename)
+    print(f"{stats['rows']:,} rows in {stats['seconds']:.2f}s ({stats['rows_per_s']:,.0f} rows/s)")
+    for m, s, r, a in zip(kpis["months"], kpis["sales"], kpis["roi"], kpis["anomaly"]):
+        print(f"{m}  sales {s:14,.2f}  roi {r:6.3f}  {'anomaly' if a else ''}")
@@ -0,0 +1,84 @@
+"""
+correlation.py -
+
+Pearson correlation matrix shared by ex3.py, ex5.py and ex9.py.
+
+Every column is centred and scaled once and the whole matrix comes from a
+single matrix product, instead of recomputing means and sums of squares
+for each pair of metrics. Missing values (NaN) can be handled
+pairwise-complete: each pair uses only the rows where both are present.
+"""
+
+import numpy as np
+
+
+def as_matrix(data):
+    """
+    Turn the input into an (n rows x k metrics) float array.
+
+    Args:
+        data: dict of metric name -> values, or a 2-D array-like with one
+              column per metric.
+
+    Returns:
+        (X, names): the array and the metric names (None for array input).
+    """
+    if isinstance(data, dict):
+        names = list(data.keys())
+        return np.column_stack([np.asarray(data[name], dtype=np.float64) for name in names]), names
+    return np.asarray(data, dtype=np.float64), None
+
+
+def correlation_matrix(data, pairwise=True):
+    """
+    Pearson correlation between every pair of columns.
+
+    Args:
+        data: dict of metric name -> values, or a 2-D array (rows x metrics).
+        pairwise (bool): With NaNs present, correlate each pair over the rows
+                         where both values exist. When False, rows with any
+                         NaN are dropped first.
+
+    Returns:
+        np.ndarray: (k x k) matrix. Columns without variation get 0, as in
+                    ex3.corr; pairs with fewer than two common rows get NaN.
+    """
+    X, _ = as_matrix(data)
+    present = ~np.isnan(X)
+    if not present.all():
+        if pairwise:
+            return _pairwise_complete(X, present)
+        X = X[present.all(axis=1)]
+
+    centred = X - X.mean(axis=0)
+    norms = np.sqrt(np.einsum("ij,ij->j", centred, centred))
+    scaled = np.divide(centred, norms, out=np.zeros_like(centred), where=norms > 0)
+    r = scaled.T @ scaled
+    return np.clip(r, -1.0, 1.0, out=r)
+
+
+def _pairwise_complete(X, present):
+    """Correlation over the rows where both columns are present, still as matrix products."""
+    mask = present.astype(np.float64)
+    # centre on each column's own mean to keep the sums small (better precision)
+    centred = np.where(present, X - np.nanmean(X, axis=0), 0.0)
+    n = mask.T @ mask                     # common rows per pair
+    s = centred.T @ mask                  # s[i, j]: sum of column i over rows shared with j
+    ss = (centred ** 2).T @ mask          # ss[i, j]: sum of squares of column i over shared rows
+    sxy = centred.T @ centred
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - s * s.T / n
+        var_i = ss - s ** 2 / n
+        var_j = var_i.T
+        den = np.sqrt(var_i * var_j)
+        r = np.where(den > 0, cov / den, 0.0)
+    r[n < 2] = np.nan
+    return np.clip(r, -1.0, 1.0, out=r)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    wide = rng.normal(size=(10_000, 300))
+    wide[rng.random(wide.shape) < 0.01] = np.nan
+    r = correlation_matrix(wide)
+    print("300 metrics with 1% missing values ->", r.shape)
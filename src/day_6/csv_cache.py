@@ -0,0 +1,202 @@
+"""
+csv_cache.py -
+
+Binary columnar cache for the CSV files in data/.
+
+The first load_columns() of a CSV parses it once, infers a type for every
+column (int64, float64, datetime64[s] or a fixed-width string) and saves
+each column as a .npy file next to a schema.json describing the source.
+Later loads memory-map the .npy files (np.load(mmap_mode='r')), so nothing
+is parsed or copied until the data is actually used.
+
+The cache is rebuilt when the source changes: size and modification time
+are compared first, and when only the mtime differs the content hash
+decides (a touched but unchanged file keeps its cache).
+
+    python src/day_6/csv_cache.py data/*.csv
+"""
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+CACHE_DIR = ".npy_cache"
+SCHEMA_FILE = "schema.json"
+VERSION = 1
+
+
+def file_hash(path, block_size=1 << 20):
+    """SHA-256 of a file's content."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_path(csv_filename, cache_dir=None):
+    """Directory holding the cache of a CSV file (by default data/.npy_cache/<file name>)."""
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(csv_filename)), CACHE_DIR)
+    return os.path.join(cache_dir, os.path.basename(csv_filename))
+
+
+def infer_column(values):
+    """
+    Convert a column of CSV strings to the narrowest fitting NumPy type.
+
+    Empty fields become NaN in float columns and NaT in date columns; a
+    column that is neither numeric nor a date stays a string column.
+    """
+    has_missing = "" in values
+    if not has_missing:
+        try:
+            return np.array(values, dtype=np.int64)
+        except ValueError:
+            pass
+    try:
+        return np.array([v or "nan" for v in values] if has_missing else values, dtype=np.float64)
+    except ValueError:
+        pass
+    try:
+        return np.array(values, dtype="datetime64[s]")
+    except ValueError:
+        pass
+    return np.array(values, dtype=str)
+
+
+def data_rows(reader, n_columns, csv_filename):
+    """Yield the non-blank rows of a csv.reader, checking that each has `n_columns` fields."""
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != n_columns:
+            raise ValueError(
+                f"{csv_filename}, line {reader.line_num}: expected {n_columns} fields, got {len(row)}"
+            )
+        yield row
+
+
+def parse_csv(csv_filename, dtypes=None, encoding="utf-8-sig"):
+    """
+    Parse a whole CSV file into typed columns.
+
+    Args:
+        csv_filename (str): Path of a CSV file with a header row.
+        dtypes (dict): Column -> NumPy dtype for columns that should not be inferred.
+        encoding (str): File encoding; the default also strips a UTF-8 BOM.
+
+    Returns:
+        dict: Column name -> NumPy array.
+    """
+    dtypes = dtypes or {}
+    with open(csv_filename, mode="r", newline="", encoding=encoding) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        columns = list(zip(*data_rows(reader, len(header), csv_filename))) or [()] * len(header)
+    return {
+        name: np.array(values, dtype=dtypes[name]) if name in dtypes else infer_column(values)
+        for name, values in zip(header, columns)
+    }
+
+
+def _source_info(csv_filename):
+    stat = os.stat(csv_filename)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _read_schema(path):
+    try:
+        with open(os.path.join(path, SCHEMA_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_fresh(schema, csv_filename, path, dtypes):
+    """Check a cache against its source; refresh the stored mtime when only the mtime changed."""
+    if schema is None or schema.get("version") != VERSION or schema.get("dtypes") != _dtype_names(dtypes):
+        return False
+    info = _source_info(csv_filename)
+    if info["size"] != schema["size"]:
+        return False
+    if info["mtime_ns"] == schema["mtime_ns"]:
+        return True
+    if file_hash(csv_filename) != schema["sha256"]:
+        return False
+    schema["mtime_ns"] = info["mtime_ns"]
+    with open(os.path.join(path, SCHEMA_FILE), "w", encoding="utf-8") as f:
+        json.dump(schema, f, indent=2)
+    return True
+
+
+def _dtype_names(dtypes):
+    return {name: np.dtype(dtype).str for name, dtype in (dtypes or {}).items()}
+
+
+def build_cache(csv_filename, cache_dir=None, dtypes=None, encoding="utf-8-sig"):
+    """Parse a CSV file and (re)write its cache; returns the cache directory."""
+    path = cache_path(csv_filename, cache_dir)
+    info = _source_info(csv_filename)
+    sha256 = file_hash(csv_filename)
+    columns = parse_csv(csv_filename, dtypes, encoding)
+
+    # write into a temporary directory and swap it in, so readers never see half a cache
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    schema = {"version": VERSION, "source": os.path.abspath(csv_filename), **info, "sha256": sha256,
+              "dtypes": _dtype_names(dtypes), "rows": 0, "columns": []}
+    for i, (name, values) in enumerate(columns.items()):
+        filename = f"{i:03d}.npy"
+        np.save(os.path.join(tmp, filename), values)
+        schema["columns"].append({"name": name, "file": filename, "dtype": values.dtype.str})
+        schema["rows"] = len(values)
+    with open(os.path.join(tmp, SCHEMA_FILE), "w", encoding="utf-8") as f:
+        json.dump(schema, f, indent=2)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+    return path
+
+
+def load_columns(csv_filename, cache_dir=None, dtypes=None, encoding="utf-8-sig"):
+    """
+    Columns of a CSV file, from the binary cache when it is up to date.
+
+    Args:
+        csv_filename (str): Path of a CSV file with a header row.
+        cache_dir (str): Where caches live (default: .npy_cache next to the CSV).
+        dtypes (dict): Column -> NumPy dtype overriding the inferred types.
+        encoding (str): File encoding used when (re)building the cache.
+
+    Returns:
+        dict: Column name -> read-only memory-mapped NumPy array.
+    """
+    path = cache_path(csv_filename, cache_dir)
+    schema = _read_schema(path)
+    if not _is_fresh(schema, csv_filename, path, dtypes):
+        path = build_cache(csv_filename, cache_dir, dtypes, encoding)
+        schema = _read_schema(path)
+    return {
+        column["name"]: np.load(os.path.join(path, column["file"]), mmap_mode="r")
+        for column in schema["columns"]
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    for csv_filename in sys.argv[1:] or ["data/daily_sales_data.csv"]:
+        start = time.perf_counter()
+        parse_csv(csv_filename)
+        parsed = time.perf_counter() - start
+        load_columns(csv_filename)  # make sure the cache exists
+        start = time.perf_counter()
+        columns = load_columns(csv_filename)
+        loaded = time.perf_counter() - start
+        types = ", ".join(f"{name}:{values.dtype}" for name, values in columns.items())
+        print(f"{os.path.basename(csv_filename):30} parse {parsed * 1000:8.2f} ms  cached {loaded * 1000:6.2f} ms  {types}")
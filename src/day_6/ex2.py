@@ -10,65 +10,25 @@ perform a simple sales forecast, and create visualizations using Matplotlib.
 
 
 
-from datetime import datetime, timedelta
-import random
-from statistics import mean, stdev
 import matplotlib.pyplot as plt
 
-
-
-import csv
+from monthly_kpis import read_daily, monthly_kpis
+from forecasting import forecast
 
 csv_filename = "data/daily_sales_data.csv"
 
 
-#read data from csv as list of dictionaries
-data = []   
-
-with open(csv_filename, mode="r", newline="", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        #convert date string to datetime object
-        row["date"] = datetime.strptime(row["date"], "%Y-%m-%d %H:%M:%S")
-        #convert sales and marketing_spend to float
-        row["sales"] = float(row["sales"])
-        row["marketing_spend"] = float(row["marketing_spend"])
-        data.append(row)
-
-
-# Helper: get month string like '2024-03'
-def month_key(date):
-    return f"{date.year}-{date.month:02d}"
+# read data from csv as NumPy columns (dates parsed in bulk into datetime64)
+data = read_daily(csv_filename, cache=True)
 
 
 ################################################################################################################################
 
-# 2️⃣ Aggregate Monthly KPIs
-monthly = {}
-for entry in data:
-    month = month_key(entry["date"])
-    if month not in monthly:
-        monthly[month] = {"sales": 0, "marketing_spend": 0}
-    monthly[month]["sales"] += entry["sales"]
-    monthly[month]["marketing_spend"] += entry["marketing_spend"]
-
-# Calculate ROI and detect anomalies
-months = sorted(monthly.keys())
-roi_values = []
-
-for m in months:
-    s = monthly[m]["sales"]
-    sp = monthly[m]["marketing_spend"]
-    roi = (s - sp) / sp if sp else 0
-    monthly[m]["roi"] = roi
-    roi_values.append(roi)
-
-mean_roi = mean(roi_values)
-stdev_roi = stdev(roi_values)
-threshold = mean_roi - 2 * stdev_roi
-
-for m in months:
-    monthly[m]["anomaly"] = "Yes" if monthly[m]["roi"] < threshold else "No"
+# 2️⃣ Aggregate Monthly KPIs, calculate ROI and detect anomalies
+# (integer month codes + np.bincount instead of month_key() strings and nested dicts)
+kpis = monthly_kpis(data["date"], data["sales"], data["marketing_spend"])
+months = kpis["months"]
+threshold = kpis["threshold"]
 
 ################################################################################################################################
 
@@ -77,21 +37,20 @@ for m in months:
 
 
 # 3️⃣ Simple Forecast (Predictive Logic)
-if len(months) >= 2:
-    last_sales = monthly[months[-1]]["sales"]
-    prev_sales = monthly[months[-2]]["sales"]
-    growth_rate = (last_sales - prev_sales) / prev_sales if prev_sales else 0
-    predicted_sales = last_sales * (1 + growth_rate)
-else:
-    predicted_sales = 0
+# linear trend + monthly seasonality fitted to all months, see forecasting.py
+prev_sales, last_sales = (float(v) for v in kpis["sales"][-2:]) if len(months) >= 2 else (None, None)
+sales_forecast = forecast(kpis["sales"], horizon=1, start=int(months[0][5:7]) - 1) if len(months) else None
+predicted_sales = float(sales_forecast["mean"][0]) if sales_forecast else 0
 
 print(f"prev_sales = {prev_sales} last_sales = {last_sales} Predicted next month sales: ${predicted_sales:,.2f}")
+if sales_forecast:
+    print(f"95% interval: ${sales_forecast['lower'][0]:,.2f} - ${sales_forecast['upper'][0]:,.2f}")
 
 # Prepare data for plotting
-sales = [monthly[m]["sales"] for m in months]
-roi = [monthly[m]["roi"] for m in months]
-spend = [monthly[m]["marketing_spend"] for m in months]
-anomaly_flags = [monthly[m]["anomaly"] == "Yes" for m in months]
+sales = list(kpis["sales"])
+roi = list(kpis["roi"])
+spend = list(kpis["marketing_spend"])
+anomaly_flags = list(kpis["anomaly"])
 
 ################################################################################################################################
 
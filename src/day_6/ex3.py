@@ -3,10 +3,10 @@ ex3.py
 
 ETL & KPI computation
 
-Clustering (K-Means implemented manually)
-Anomaly detection (Isolation Forest-like logic)
-Predictive forecasting (basic Random Forest-style ensemble logic with standard library)
-Correlation analysis
+Clustering (vectorized K-Means, kmeans_np.py)
+Anomaly detection (ROI threshold and Isolation Forest, isolation_forest.py)
+Predictive forecasting (linear trend + monthly seasonality, forecasting.py)
+Correlation analysis (correlation matrix, correlation.py)
 Matplotlib visualization
 
 
@@ -19,7 +19,11 @@ import random
 from datetime import datetime, timedelta
 from statistics import mean, stdev
 import matplotlib.pyplot as plt
-import math
+
+from kmeans_np import kmeans
+from correlation import correlation_matrix
+from isolation_forest import IsolationForest
+from forecasting import forecast
 
 # ============================================================
 # 1️⃣ ETL & DATA PREPARATION
@@ -74,45 +78,21 @@ for m, v in monthly.items():
 months = sorted(monthly.keys())
 
 # ============================================================
-# 3️⃣ SIMPLE K-MEANS CLUSTERING (3 clusters)
+# 3️⃣ K-MEANS CLUSTERING (5 clusters)
 # ============================================================
 
-def euclidean(p1, p2):
-    return math.sqrt(sum((a - b)**2 for a, b in zip(p1, p2)))
-
-def kmeans(data_points, k=3, max_iter=100):
-    centroids = random.sample(data_points, k)
-    for _ in range(max_iter):
-        clusters = [[] for _ in range(k)]
-        for point in data_points:
-            distances = [euclidean(point, c) for c in centroids]
-            clusters[distances.index(min(distances))].append(point)
-        new_centroids = []
-        for cluster in clusters:
-            if cluster:
-                new_centroids.append([sum(vals)/len(vals) for vals in zip(*cluster)])
-            else:
-                new_centroids.append(random.choice(data_points))
-        if all(euclidean(a, b) < 1e-4 for a, b in zip(centroids, new_centroids)):
-            break
-        centroids = new_centroids
-    assignments = []
-    for point in data_points:
-        distances = [euclidean(point, c) for c in centroids]
-        assignments.append(distances.index(min(distances)))
-    return assignments
-
+# vectorized NumPy K-Means (k-means++ seeding, batched distances), see kmeans_np.py
 features = [
     [monthly[m]["sales"], monthly[m]["marketing_spend"], monthly[m]["roi"],
      monthly[m]["conversion_rate"], monthly[m]["customer_satisfaction"]]
     for m in months
 ]
-clusters = kmeans(features, k=5)
+clusters = kmeans(features, k=5, seed=42)
 for i, m in enumerate(months):
     monthly[m]["performance_cluster"] = clusters[i]
 
 # ============================================================
-# 4️⃣ ANOMALY DETECTION (Simple Isolation Logic)
+# 4️⃣ ANOMALY DETECTION (ROI THRESHOLD & ISOLATION FOREST)
 # ============================================================
 
 roi_vals = [monthly[m]["roi"] for m in months]
@@ -123,37 +103,37 @@ threshold = mean_roi - 2 * std_roi
 for m in months:
     monthly[m]["anomaly_flag"] = "Anomaly" if monthly[m]["roi"] < threshold else "Normal"
 
+# Isolation Forest over all five monthly features (see isolation_forest.py)
+forest = IsolationForest(n_trees=200, seed=42).fit(features)
+isolation_scores = forest.score_samples(features)
+for m, score in zip(months, isolation_scores):
+    monthly[m]["isolation_score"] = float(score)
+    monthly[m]["isolation_flag"] = "Anomaly" if score > 0.6 else "Normal"
+
+print("Most isolated months:", sorted(months, key=lambda m: -monthly[m]["isolation_score"])[:3])
+
 # ============================================================
-# 5️⃣ PREDICTIVE MODELING (Basic Ensemble Forecast)
+# 5️⃣ PREDICTIVE MODELING (TREND + SEASONALITY FORECAST)
 # ============================================================
 
 def forecast_next_sales(months, monthly):
     if len(months) < 3:
         return None
-    last = monthly[months[-1]]["sales"]
-    prev = monthly[months[-2]]["sales"]
-    growth = (last - prev) / prev if prev else 0
-    # Weighted ensemble of linear and random perturbation
-    prediction = last * (1 + growth * 0.7 + random.uniform(-0.03, 0.03))
-    return prediction
+    # linear trend + monthly seasonality over all months, see forecasting.py
+    result = forecast([monthly[m]["sales"] for m in months], horizon=1, start=int(months[0][5:7]) - 1)
+    return float(result["mean"][0]), float(result["lower"][0]), float(result["upper"][0])
 
-predicted_sales = forecast_next_sales(months, monthly)
-print(f"Predicted next month sales: ${predicted_sales:,.2f}")
+predicted_sales, lower_sales, upper_sales = forecast_next_sales(months, monthly)
+print(f"Predicted next month sales: ${predicted_sales:,.2f} (95% interval ${lower_sales:,.2f} - ${upper_sales:,.2f})")
 
 # ============================================================
-# 6️⃣ CORRELATION ANALYSIS (MANUAL)
+# 6️⃣ CORRELATION ANALYSIS (CORRELATION MATRIX)
 # ============================================================
 
-def corr(x, y):
-    mean_x, mean_y = mean(x), mean(y)
-    num = sum((a - mean_x)*(b - mean_y) for a, b in zip(x, y))
-    den = math.sqrt(sum((a - mean_x)**2 for a in x) * sum((b - mean_y)**2 for b in y))
-    return num / den if den else 0
-
 metrics = ["sales", "marketing_spend", "roi", "conversion_rate", "customer_satisfaction"]
-corr_matrix = {m1: {m2: corr(
-    [monthly[k][m1] for k in months],
-    [monthly[k][m2] for k in months]) for m2 in metrics} for m1 in metrics}
+# one matrix product for all pairs, see correlation.py
+corr_values = correlation_matrix({m: [monthly[k][m] for k in months] for m in metrics})
+corr_matrix = {m1: {m2: float(corr_values[i, j]) for j, m2 in enumerate(metrics)} for i, m1 in enumerate(metrics)}
 
 # Print correlation matrix
 print("\nCorrelation Matrix:")
@@ -20,6 +20,8 @@ import random
 import math
 import matplotlib.pyplot as plt
 
+from correlation import correlation_matrix
+
 # Step 1: Generate synthetic business data
 n = 60
 revenue = [random.uniform(1000, 5000) for _ in range(n)]
@@ -36,18 +38,10 @@ data = {
     "Employee Productivity": employee_productivity
 }
 
-# Step 2: Compute correlation manually
-def correlation(x, y):
-    mean_x = sum(x) / len(x)
-    mean_y = sum(y) / len(y)
-    num = sum((a - mean_x) * (b - mean_y) for a, b in zip(x, y))
-    den_x = math.sqrt(sum((a - mean_x)**2 for a in x))
-    den_y = math.sqrt(sum((b - mean_y)**2 for b in y))
-    return num / (den_x * den_y)
-
+# Step 2: Compute correlation matrix (single matrix product, see correlation.py)
 keys = list(data.keys())
 size = len(keys)
-corr_matrix = [[correlation(data[keys[i]], data[keys[j]]) for j in range(size)] for i in range(size)]
+corr_matrix = correlation_matrix(data)
 
 # Step 3: Layout nodes in a circle
 radius = 3
@@ -0,0 +1,206 @@
+"""
+kmeans_np.py -
+
+Vectorized K-Means with NumPy (replacement for the pure-Python kmeans in ex3.py).
+
+- squared distances for a whole block of points at once, using
+  ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2
+- k-means++ seeding
+- empty clusters are re-seeded with the point farthest from its centroid
+- stops when no centroid moves more than `tol`
+
+Memory and time are linear in the number of points: distances are
+computed in blocks of `chunk_size` rows.
+
+algorithm="hamerly" keeps an upper bound on the distance to the assigned
+centroid and a lower bound on the distance to the second closest one for
+every point (Hamerly, 2010). Points whose bounds prove the assignment
+cannot change are skipped, which removes most distance computations once
+the clusters settle. Both algorithms give the same clustering (only the
+choice of points for re-seeding empty clusters can differ, as Hamerly
+ranks points by their upper bound).
+"""
+
+import numpy as np
+
+
+def squared_distances(X, centroids, x_sq=None):
+    """Squared Euclidean distances between every row of X and every centroid, shape (n, k)."""
+    if x_sq is None:
+        x_sq = np.einsum("ij,ij->i", X, X)
+    c_sq = np.einsum("ij,ij->i", centroids, centroids)
+    d = x_sq[:, None] - 2 * X @ centroids.T + c_sq[None, :]
+    return np.maximum(d, 0, out=d)  # rounding can make tiny distances negative
+
+
+def assign(X, centroids, chunk_size=65536, x_sq=None):
+    """
+    Nearest centroid for every point.
+
+    Returns:
+        (labels, min_sq_dist): cluster index and squared distance per point.
+    """
+    n = len(X)
+    if x_sq is None:
+        x_sq = np.einsum("ij,ij->i", X, X)
+    labels = np.empty(n, dtype=np.int64)
+    min_d = np.empty(n)
+    for start in range(0, n, chunk_size):
+        stop = start + chunk_size
+        d = squared_distances(X[start:stop], centroids, x_sq[start:stop])
+        labels[start:stop] = d.argmin(axis=1)
+        min_d[start:stop] = d[np.arange(len(d)), labels[start:stop]]
+    return labels, min_d
+
+
+def kmeans_plus_plus(X, k, rng):
+    """Pick k initial centroids with k-means++ (D^2 weighting)."""
+    n = len(X)
+    centroids = np.empty((k, X.shape[1]))
+    centroids[0] = X[rng.integers(n)]
+    closest = squared_distances(X, centroids[:1])[:, 0]
+    for i in range(1, k):
+        total = closest.sum()
+        idx = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+        centroids[i] = X[idx]
+        closest = np.minimum(closest, squared_distances(X, centroids[i:i + 1])[:, 0])
+    return centroids
+
+
+def update_centroids(X, labels, min_d, centroids):
+    """Mean of each cluster; empty clusters take the points farthest from their centroid."""
+    k = len(centroids)
+    counts = np.bincount(labels, minlength=k)
+    sums = np.stack([np.bincount(labels, weights=X[:, j], minlength=k) for j in range(X.shape[1])], axis=1)
+    new = centroids.copy()
+    filled = counts > 0
+    new[filled] = sums[filled] / counts[filled, None]
+    empty = np.flatnonzero(~filled)
+    if len(empty):
+        farthest = np.argsort(min_d)[::-1][:len(empty)]
+        new[empty] = X[farthest]
+    return new
+
+
+def _two_nearest(X, centroids, chunk_size=65536):
+    """Closest centroid, its distance and the distance to the second closest, per point."""
+    n = len(X)
+    labels = np.empty(n, dtype=np.int64)
+    first = np.empty(n)
+    second = np.full(n, np.inf)
+    for start in range(0, n, chunk_size):
+        stop = start + chunk_size
+        d = squared_distances(X[start:stop], centroids)
+        part = np.argpartition(d, 1, axis=1)[:, :2] if d.shape[1] > 1 else np.zeros((len(d), 1), dtype=np.int64)
+        rows = np.arange(len(d))
+        d_part = d[rows[:, None], part]
+        order = np.argsort(d_part, axis=1)
+        labels[start:stop] = part[rows, order[:, 0]]
+        first[start:stop] = d_part[rows, order[:, 0]]
+        if d.shape[1] > 1:
+            second[start:stop] = d_part[rows, order[:, 1]]
+    return labels, np.sqrt(first), np.sqrt(second)
+
+
+def _hamerly_assign(X, centroids, labels, upper, lower, chunk_size):
+    """
+    One bounded assignment step; updates labels and bounds in place.
+
+    Returns:
+        int: Point-to-centroid distances computed.
+    """
+    k = len(centroids)
+    cc = np.sqrt(squared_distances(centroids, centroids))
+    np.fill_diagonal(cc, np.inf)
+    half_gap = 0.5 * cc.min(axis=1)  # a point closer than this to its centroid cannot change cluster
+    bound = np.maximum(half_gap[labels], lower)
+    check = np.flatnonzero(upper > bound)
+    # tighten the upper bound with the exact distance to the assigned centroid
+    diff = X[check] - centroids[labels[check]]
+    upper[check] = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    full = check[upper[check] > bound[check]]
+    if len(full):
+        labels[full], upper[full], lower[full] = _two_nearest(X[full], centroids, chunk_size)
+    return len(check) + len(full) * k
+
+
+def _move_bounds(upper, lower, labels, shift):
+    """Loosen the bounds after the centroids moved by `shift`."""
+    upper += shift[labels]
+    if len(shift) > 1:
+        top = np.argsort(shift)[::-1][:2]
+        # the lower bound concerns the other centroids, so use the largest shift among them
+        lower -= np.where(labels == top[0], shift[top[1]], shift[top[0]])
+
+
+def kmeans_fit(data_points, k=3, max_iter=100, tol=1e-4, seed=None, chunk_size=65536, algorithm="lloyd"):
+    """
+    Cluster points with Lloyd's algorithm.
+
+    Args:
+        data_points (array-like): n points with d features each.
+        k (int): Number of clusters.
+        max_iter (int): Maximum Lloyd iterations.
+        tol (float): Stop when no centroid moves more than this.
+        seed (int): Seed for k-means++ (None for a random seed).
+        chunk_size (int): Points per distance block.
+        algorithm (str): 'lloyd' (all distances every iteration) or
+                         'hamerly' (skip distances the bounds rule out).
+
+    Returns:
+        dict: labels, centroids, inertia (sum of squared distances), n_iter,
+              distance_evals (point-to-centroid distances computed) and
+              distance_evals_avoided (compared to plain Lloyd).
+    """
+    if algorithm not in ("lloyd", "hamerly"):
+        raise ValueError(f"unknown algorithm {algorithm!r}")
+    X = np.asarray(data_points, dtype=np.float64)
+    n = len(X)
+    rng = np.random.default_rng(seed)
+    centroids = kmeans_plus_plus(X, k, rng)
+    if algorithm == "hamerly":
+        return _fit_hamerly(X, centroids, max_iter, tol, chunk_size)
+    x_sq = np.einsum("ij,ij->i", X, X)
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        labels, min_d = assign(X, centroids, chunk_size, x_sq)
+        new_centroids = update_centroids(X, labels, min_d, centroids)
+        shift = np.sqrt(((new_centroids - centroids) ** 2).sum(axis=1)).max()
+        centroids = new_centroids
+        if shift < tol:
+            break
+    labels, min_d = assign(X, centroids, chunk_size, x_sq)
+    return {
+        "labels": labels, "centroids": centroids, "inertia": float(min_d.sum()), "n_iter": n_iter,
+        "distance_evals": (n_iter + 1) * n * k, "distance_evals_avoided": 0,
+    }
+
+
+def _fit_hamerly(X, centroids, max_iter, tol, chunk_size):
+    """Lloyd iterations with Hamerly's bounds; same steps as the plain loop in kmeans_fit."""
+    n, k = len(X), len(centroids)
+    labels, upper, lower = _two_nearest(X, centroids, chunk_size)
+    evals = n * k
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        if n_iter > 1:
+            evals += _hamerly_assign(X, centroids, labels, upper, lower, chunk_size)
+        new_centroids = update_centroids(X, labels, upper ** 2, centroids)
+        shift = np.sqrt(((new_centroids - centroids) ** 2).sum(axis=1))
+        centroids = new_centroids
+        _move_bounds(upper, lower, labels, shift)
+        if shift.max() < tol:
+            break
+    evals += _hamerly_assign(X, centroids, labels, upper, lower, chunk_size)
+    diff = X - centroids[labels]
+    min_d = np.einsum("ij,ij->i", diff, diff)
+    evals += n
+    return {
+        "labels": labels, "centroids": centroids, "inertia": float(min_d.sum()), "n_iter": n_iter,
+        "distance_evals": evals, "distance_evals_avoided": (n_iter + 1) * n * k - evals,
+    }
+
+
+def kmeans(data_points, k=3, max_iter=100, tol=1e-4, seed=None, algorithm="lloyd"):
+    """Same API as ex3.kmeans: return the cluster index of every point as a list."""
+    return kmeans_fit(data_points, k, max_iter, tol, seed, algorithm=algorithm)["labels"].tolist()
@@ -0,0 +1,211 @@
+"""
+minibatch_kmeans.py -
+
+Mini-batch K-Means for customer bases that do not fit in memory.
+
+MiniBatchKMeans learns centroids from a stream of feature chunks
+(partial_fit), moving each centroid towards the mean of the points it
+receives with a per-centroid learning rate 1/count (Sculley, 2010).
+parallel_assign() then labels the full stream in a process pool, keeping
+only a few chunks in flight at a time.
+
+customer_feature_chunks() builds per-customer features by joining
+data/customers.csv with aggregated data/retail_orders.csv.
+
+    python src/day_6/minibatch_kmeans.py
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chunked_csv import iter_blocks
+from kmeans_np import assign, kmeans_plus_plus
+
+
+class MiniBatchKMeans:
+    """K-Means trained one chunk at a time."""
+
+    def __init__(self, k=4, seed=None, chunk_size=65536):
+        """
+        Args:
+            k (int): Number of clusters.
+            seed (int): Seed for the k-means++ initialisation.
+            chunk_size (int): Points per distance block inside a chunk.
+        """
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.chunk_size = chunk_size
+        self.centroids = None
+        self.counts = np.zeros(k)
+        self._pending = []  # chunks kept until there are enough points to initialise
+
+    def partial_fit(self, X):
+        """Update the centroids with one chunk of points."""
+        X = np.asarray(X, dtype=np.float64)
+        if self.centroids is None:
+            self._pending.append(X)
+            pending = np.concatenate(self._pending)
+            if len(pending) < self.k:
+                return self
+            self._pending = []
+            self.centroids = kmeans_plus_plus(pending, self.k, self.rng)
+            X = pending
+        labels, _ = assign(X, self.centroids, self.chunk_size)
+        batch_counts = np.bincount(labels, minlength=self.k)
+        batch_sums = np.stack(
+            [np.bincount(labels, weights=X[:, j], minlength=self.k) for j in range(X.shape[1])], axis=1
+        )
+        self.counts += batch_counts
+        moved = batch_counts > 0
+        # c <- c + (sum of batch points - n_batch * c) / n_total, the per-point 1/count rule applied per batch
+        self.centroids[moved] += (
+            batch_sums[moved] - batch_counts[moved, None] * self.centroids[moved]
+        ) / self.counts[moved, None]
+        return self
+
+    def fit_stream(self, make_chunks, epochs=1):
+        """
+        Train on a stream of chunks.
+
+        Args:
+            make_chunks (callable): Returns a fresh iterable of feature chunks
+                                    (called once per epoch).
+            epochs (int): Passes over the stream.
+        """
+        for _ in range(epochs):
+            for X in make_chunks():
+                self.partial_fit(X)
+        return self
+
+    def predict(self, X):
+        return assign(np.asarray(X, dtype=np.float64), self.centroids, self.chunk_size)[0]
+
+
+def _assign_chunk(X, centroids):
+    labels, min_d = assign(np.asarray(X, dtype=np.float64), centroids)
+    return labels, float(min_d.sum())
+
+
+def parallel_assign(chunks, centroids, workers=None, in_flight=2):
+    """
+    Label every chunk of a stream in a process pool, in order.
+
+    Args:
+        chunks (iterable): Feature chunks.
+        centroids (array): Centroids from MiniBatchKMeans or kmeans_fit.
+        workers (int): Processes (default: all cores).
+        in_flight (int): Chunks queued per worker, to bound memory.
+
+    Yields:
+        (labels, inertia): Cluster labels and summed squared distance per chunk.
+    """
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for X in chunks:
+            pending.append(pool.submit(_assign_chunk, X, centroids))
+            if len(pending) >= workers * in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class CustomerTotals:
+    """
+    Per-customer order count, units, net sales, profit and discount sum.
+
+    CustomerIDs are dictionary-encoded to row numbers of a (customers x 5)
+    array that grows geometrically as new customers appear. A block is
+    reduced per customer with np.bincount and added with one fancy-indexed
+    update, so Python only touches each distinct ID of a block once.
+    """
+
+    FIELDS = ("orders", "units", "net_sales", "profit", "discount")
+
+    def __init__(self):
+        self._lookup = {}  # CustomerID -> row of sums
+        self.sums = np.zeros((1024, len(self.FIELDS)))
+
+    def __len__(self):
+        return len(self._lookup)
+
+    def _encode(self, ids):
+        lookup = self._lookup
+        codes = np.fromiter((lookup.setdefault(c, len(lookup)) for c in ids), dtype=np.int64, count=len(ids))
+        if len(lookup) > len(self.sums):
+            grown = np.zeros((max(len(lookup), 2 * len(self.sums)), len(self.FIELDS)))
+            grown[:len(self.sums)] = self.sums
+            self.sums = grown
+        return codes
+
+    def add_block(self, customer_ids, units, net_sales, profit, discount):
+        """Add the order rows of one block."""
+        ids, inverse = np.unique(customer_ids, return_inverse=True)
+        block_sums = np.column_stack([np.bincount(inverse, minlength=len(ids))] + [
+            np.bincount(inverse, weights=values, minlength=len(ids))
+            for values in (units, net_sales, profit, discount)
+        ])
+        codes = self._encode(ids.tolist())  # before indexing: encoding may grow self.sums
+        self.sums[codes] += block_sums  # distinct codes, so += adds every row
+        return self
+
+    def get(self, customer_ids):
+        """(len(customer_ids), 5) totals in FIELDS order; zeros for customers without orders."""
+        lookup = self._lookup
+        codes = np.fromiter((lookup.get(c, -1) for c in customer_ids), dtype=np.int64, count=len(customer_ids))
+        return np.where((codes >= 0)[:, None], self.sums[codes], 0.0)
+
+
+def order_aggregates(orders_csv, block_rows=100_000):
+    """Per-customer order count, units, net sales, profit and discount sum from the orders file."""
+    totals = CustomerTotals()
+    dtypes = {"UnitsSold": np.float64, "NetSales": np.float64, "Profit": np.float64, "DiscountPct": np.float64}
+    for block in iter_blocks(orders_csv, block_rows, dtypes):
+        totals.add_block(block["CustomerID"], block["UnitsSold"], block["NetSales"], block["Profit"],
+                         block["DiscountPct"])
+    return totals
+
+
+def customer_feature_chunks(customers_csv="data/customers.csv", orders_csv="data/retail_orders.csv",
+                            chunk_rows=100_000, totals=None):
+    """
+    Yield (customer_ids, features) chunks for clustering.
+
+    Features: log(1 + net sales), number of orders, units per order,
+    average discount and profit margin. Customers without orders get zeros.
+    The order aggregates take O(customers) memory, as arrays (see CustomerTotals);
+    the customer file is streamed.
+    """
+    totals = order_aggregates(orders_csv) if totals is None else totals
+    for block in iter_blocks(customers_csv, chunk_rows, dtypes={}):
+        ids = block["CustomerID"]
+        orders, units, net_sales, profit, discount = totals.get(ids.tolist()).T
+        per_order = np.maximum(orders, 1)
+        features = np.column_stack([
+            np.log1p(net_sales),
+            orders,
+            units / per_order,
+            discount / per_order,
+            np.divide(profit, net_sales, out=np.zeros_like(profit), where=net_sales != 0),
+        ])
+        yield ids, features
+
+
+if __name__ == "__main__":
+    totals = order_aggregates("data/retail_orders.csv")
+
+    def feature_stream():
+        return (features for _, features in customer_feature_chunks(chunk_rows=100, totals=totals))
+
+    model = MiniBatchKMeans(k=4, seed=42).fit_stream(feature_stream, epochs=3)
+    labels, inertia = [], 0.0
+    for chunk_labels, chunk_inertia in parallel_assign(feature_stream(), model.centroids, workers=2):
+        labels.append(chunk_labels)
+        inertia += chunk_inertia
+    labels = np.concatenate(labels)
+    print("Customers per segment:", np.bincount(labels, minlength=model.k))
+    print("Inertia:", round(inertia, 2))
+    print("Centroids:\n", np.round(model.centroids, 3))
@@ -0,0 +1,133 @@
+"""
+monthly_kpis.py -
+
+Vectorized monthly KPIs for daily sales data (same outputs as ex2.py).
+
+Dates are parsed in bulk into datetime64, bucketed into integer month codes
+(months since 1970-01) and summed with np.bincount, instead of strptime,
+f-string month keys and nested dicts per row.
+"""
+
+import csv
+
+import numpy as np
+
+from csv_cache import data_rows, load_columns
+
+
+DAILY_COLUMNS = {
+    "date": "datetime64[s]",
+    "region": str,
+    "sales": np.float64,
+    "marketing_spend": np.float64,
+}
+
+
+def read_daily(csv_filename, cache=False):
+    """
+    Read a date,region,sales,marketing_spend CSV into NumPy columns.
+
+    With cache=True the columns come from the binary cache of csv_cache.py
+    (memory-mapped, rebuilt when the CSV changes) instead of being parsed.
+    """
+    if cache:
+        columns = load_columns(csv_filename, dtypes=DAILY_COLUMNS)
+        return {name: columns[name] for name in DAILY_COLUMNS}
+    with open(csv_filename, mode="r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        columns = list(zip(*data_rows(reader, len(header), csv_filename))) or [()] * len(header)
+    raw = dict(zip(header, columns))
+    return {name: np.array(raw[name], dtype=dtype) for name, dtype in DAILY_COLUMNS.items()}
+
+
+def month_codes(dates):
+    """Integer month code (months since 1970-01) for every datetime64 value."""
+    return np.asarray(dates).astype("datetime64[M]").astype(np.int64)
+
+
+def month_labels(codes):
+    """Turn month codes back into 'YYYY-MM' strings."""
+    return [str(m) for m in np.asarray(codes).astype("datetime64[M]")]
+
+
+def monthly_totals(codes, sales, spend):
+    """
+    Sum sales and marketing spend per month.
+
+    Returns:
+        (codes, sales, spend): sorted month codes that have data, with their totals.
+    """
+    codes = np.asarray(codes)
+    if codes.size == 0:
+        return codes, np.zeros(0), np.zeros(0)
+    first = codes.min()
+    offset = codes - first
+    counts = np.bincount(offset)
+    present = np.flatnonzero(counts)
+    sales_sum = np.bincount(offset, weights=sales)[present]
+    spend_sum = np.bincount(offset, weights=spend)[present]
+    return present + first, sales_sum, spend_sum
+
+
+def kpis_from_totals(codes, sales, spend):
+    """
+    ROI and the mean - 2*stdev anomaly flag from monthly totals.
+
+    Returns:
+        dict: months ('YYYY-MM'), sales, marketing_spend, roi, anomaly (bool)
+              and threshold.
+    """
+    sales = np.asarray(sales, dtype=np.float64)
+    spend = np.asarray(spend, dtype=np.float64)
+    roi = np.divide(sales - spend, spend, out=np.zeros_like(sales), where=spend != 0)
+    threshold = roi.mean() - 2 * roi.std(ddof=1) if len(roi) >= 2 else -np.inf
+    return {
+        "months": month_labels(codes),
+        "sales": sales,
+        "marketing_spend": spend,
+        "roi": roi,
+        "anomaly": roi < threshold,
+        "threshold": threshold,
+    }
+
+
+def monthly_kpis(dates, sales, spend):
+    """Monthly sales, spend, ROI and anomaly flags from daily columns."""
+    return kpis_from_totals(*monthly_totals(month_codes(dates), sales, spend))
+
+
+def growth_forecast(monthly_sales):
+    """
+    Next month's sales from the last month-over-month growth rate.
+
+    Returns:
+        (prev_sales, last_sales, predicted_sales)
+    """
+    if len(monthly_sales) < 2:
+        return None, None, 0
+    prev_sales, last_sales = float(monthly_sales[-2]), float(monthly_sales[-1])
+    growth_rate = (last_sales - prev_sales) / prev_sales if prev_sales else 0
+    return prev_sales, last_sales, last_sales * (1 + growth_rate)
+
+
+def to_monthly_dict(kpis):
+    """Convert the KPI arrays into ex2.py's {month: {...}} structure."""
+    return {
+        m: {
+            "sales": float(s),
+            "marketing_spend": float(sp),
+            "roi": float(r),
+            "anomaly": "Yes" if a else "No",
+        }
+        for m, s, sp, r, a in zip(kpis["months"], kpis["sales"], kpis["marketing_spend"], kpis["roi"], kpis["anomaly"])
+    }
+
+
+if __name__ == "__main__":
+    daily = read_daily("data/daily_sales_data.csv")
+    kpis = monthly_kpis(daily["date"], daily["sales"], daily["marketing_spend"])
+    for m, s, r, a in zip(kpis["months"], kpis["sales"], kpis["roi"], kpis["anomaly"]):
+        print(f"{m}  sales {s:12,.2f}  roi {r:6.3f}  {'anomaly' if a else ''}")
+    prev_sales, last_sales, predicted_sales = growth_forecast(kpis["sales"])
+    print(f"Predicted next month sales: ${predicted_sales:,.2f}")
@@ -0,0 +1,101 @@
+"""
+online_cov.py -
+
+Streaming covariance / correlation accumulator.
+
+Rows arrive in chunks (from a CSV file, a database cursor, ...). Each chunk
+is reduced to its count, mean and centred cross-product matrix, and merged
+into the running state with Chan et al.'s pairwise update, the chunked form
+of Welford's algorithm. Memory is O(k^2) for k metrics regardless of the
+number of rows, and because sums are taken around the running means the
+result stays accurate for large-magnitude columns such as revenue.
+
+Partial states from parallel workers can be combined with merge(), and
+corr() can be read at any time, like df.corr() without keeping the data.
+"""
+
+import numpy as np
+
+from chunked_csv import iter_blocks
+
+
+class OnlineCovariance:
+    """Running mean and covariance of k metrics."""
+
+    def __init__(self, k, names=None):
+        """
+        Args:
+            k (int): Number of metrics (columns).
+            names (list of str): Optional metric names.
+        """
+        self.names = names
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros((k, k))  # sum of outer products of deviations from the mean
+
+    def update(self, chunk):
+        """Add a chunk of rows (rows x k). Rows containing NaN are skipped."""
+        X = np.asarray(chunk, dtype=np.float64)
+        X = X[~np.isnan(X).any(axis=1)]
+        if len(X) == 0:
+            return self
+        mean = X.mean(axis=0)
+        centred = X - mean
+        self._combine(len(X), mean, centred.T @ centred)
+        return self
+
+    def merge(self, other):
+        """Combine with the state of another accumulator (e.g. from another worker)."""
+        if other.n:
+            self._combine(other.n, other.mean, other.m2)
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b):
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * (n_b / n)
+        self.m2 = self.m2 + m2_b + np.outer(delta, delta) * (n_a * n_b / n)
+        self.n = n
+
+    def cov(self, ddof=1):
+        """Covariance matrix (sample covariance by default)."""
+        if self.n <= ddof:
+            return np.full_like(self.m2, np.nan)
+        return self.m2 / (self.n - ddof)
+
+    def corr(self):
+        """Pearson correlation matrix; metrics without variation get 0."""
+        std = np.sqrt(np.diag(self.m2))
+        outer = np.outer(std, std)
+        r = np.divide(self.m2, outer, out=np.zeros_like(self.m2), where=outer > 0)
+        return np.clip(r, -1.0, 1.0, out=r)
+
+    @classmethod
+    def from_csv(cls, csv_filename, columns, block_rows=100_000):
+        """Accumulate the given numeric columns of a CSV file block by block, skipping rows with blank fields."""
+        acc = cls(len(columns), names=list(columns))
+        for block in iter_blocks(csv_filename, block_rows, dtypes={}):
+            # blank fields become NaN, which update() drops with their rows
+            values = [np.where(block[c] == "", "nan", block[c]).astype(np.float64) for c in columns]
+            acc.update(np.column_stack(values))
+        return acc
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size=10_000):
+        """Accumulate all columns of an executed DB-API cursor using fetchmany."""
+        names = [d[0] for d in cursor.description]
+        acc = cls(len(names), names=names)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return acc
+            acc.update(np.array(rows, dtype=np.float64))
+
+
+if __name__ == "__main__":
+    columns = ["NewSales", "AvgSaleValue", "MarketingCost", "OperationalCost", "TotalRevenue", "Profit"]
+    acc = OnlineCovariance.from_csv("data/business_sales_trends.csv", columns, block_rows=100)
+    print(f"{acc.n} rows")
+    for name, row in zip(columns, acc.corr()):
+        print(f"{name:16}", " ".join(f"{v:6.2f}" for v in row))
@@ -0,0 +1,209 @@
+"""
+streaming_anomaly.py -
+
+Incremental anomaly detection for monthly (or daily) ROI.
+
+ex2.py and ex3.py flag months below mean(roi) - 2*stdev(roi), recomputed
+over all months every time. Here each new value is scored against the
+state built from the values before it, and then added to that state:
+
+- OnlineStats:      running mean / variance (Welford), z-score test
+- RollingMedianMAD: median and MAD of the last `window` values (robust to outliers)
+- EWMAControl:      exponentially weighted mean / variance control limits
+
+Scoring costs O(1) per value for Welford and EWMA and O(window) for the
+rolling median, independent of the length of the stream. StreamingDetector
+keeps one set of state globally and one per region.
+
+    python src/day_6/streaming_anomaly.py
+"""
+
+import math
+from bisect import bisect_left, insort
+from collections import deque
+
+MAD_SCALE = 1.4826  # MAD * 1.4826 estimates the standard deviation for normal data
+
+
+class OnlineStats:
+    """Running mean and sample variance (Welford)."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+
+    @property
+    def std(self):
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+class RollingMedianMAD:
+    """Median and median absolute deviation over a sliding window."""
+
+    def __init__(self, window=12):
+        self.window = window
+        self._values = deque()
+        self._sorted = []
+
+    def update(self, x):
+        self._values.append(x)
+        insort(self._sorted, x)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            del self._sorted[bisect_left(self._sorted, old)]
+
+    @property
+    def n(self):
+        return len(self._sorted)
+
+    @staticmethod
+    def _median(values):
+        mid = len(values) // 2
+        return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+    def median(self):
+        return self._median(self._sorted)
+
+    def mad(self):
+        med = self.median()
+        return self._median(sorted(abs(v - med) for v in self._sorted))
+
+
+class EWMAControl:
+    """EWMA mean with control limits mean +/- L * EWMA standard deviation."""
+
+    def __init__(self, alpha=0.3, L=3.0):
+        self.alpha = alpha
+        self.L = L
+        self.n = 0
+        self.mean = 0.0
+        self.var = 0.0
+
+    def update(self, x):
+        if self.n == 0:
+            self.mean = x
+        else:
+            delta = x - self.mean
+            self.mean += self.alpha * delta
+            self.var = (1 - self.alpha) * (self.var + self.alpha * delta * delta)
+        self.n += 1
+
+    def limits(self):
+        half = self.L * math.sqrt(self.var)
+        return self.mean - half, self.mean + half
+
+
+class _State:
+    def __init__(self, window, alpha, L):
+        self.stats = OnlineStats()
+        self.robust = RollingMedianMAD(window)
+        self.ewma = EWMAControl(alpha, L)
+
+    def update(self, x):
+        self.stats.update(x)
+        self.robust.update(x)
+        self.ewma.update(x)
+
+
+class StreamingDetector:
+    """Score values one at a time against global and per-region state."""
+
+    def __init__(self, z=2.0, mad_k=3.0, window=12, alpha=0.3, L=3.0, warmup=3, side="low"):
+        """
+        Args:
+            z (float): Flag values more than `z` standard deviations from the running mean.
+            mad_k (float): Flag values more than `mad_k` robust deviations from the rolling median.
+            window (int): Values kept for the rolling median / MAD.
+            alpha (float): EWMA smoothing factor.
+            L (float): Width of the EWMA control limits.
+            warmup (int): Values seen before a state starts flagging.
+            side (str): 'low' (only drops, like ex2/ex3), 'high' or 'both'.
+        """
+        self.z, self.mad_k, self.warmup, self.side = z, mad_k, warmup, side
+        self._params = (window, alpha, L)
+        self.global_state = _State(*self._params)
+        self.regions = {}
+
+    def _outside(self, x, low, high):
+        if self.side == "low":
+            return x < low
+        if self.side == "high":
+            return x > high
+        return x < low or x > high
+
+    def _check(self, state, x):
+        if state.stats.n < self.warmup:
+            return {"zscore": False, "mad": False, "ewma": False}
+        mean, std = state.stats.mean, state.stats.std
+        med, mad = state.robust.median(), MAD_SCALE * state.robust.mad()
+        low, high = state.ewma.limits()
+        return {
+            "zscore": std > 0 and self._outside(x, mean - self.z * std, mean + self.z * std),
+            "mad": mad > 0 and self._outside(x, med - self.mad_k * mad, med + self.mad_k * mad),
+            "ewma": state.ewma.var > 0 and self._outside(x, low, high),
+        }
+
+    def score(self, x, region=None):
+        """
+        Score `x`, then add it to the global (and region) state.
+
+        Returns:
+            dict: 'global' and 'region' test results, and 'anomaly' which is
+                  True when any test flags the value.
+        """
+        x = float(x)
+        result = {"global": self._check(self.global_state, x), "region": None}
+        self.global_state.update(x)
+        if region is not None:
+            state = self.regions.get(region)
+            if state is None:
+                state = self.regions[region] = _State(*self._params)
+            result["region"] = self._check(state, x)
+            state.update(x)
+        flags = list(result["global"].values()) + list((result["region"] or {}).values())
+        result["anomaly"] = any(flags)
+        return result
+
+
+def flag_monthly(monthly, months, detector=None, metric="roi", field="anomaly", labels=("Yes", "No")):
+    """
+    Flag the months of ex2/ex3's `monthly` dict in order, as a stream.
+
+    Args:
+        monthly (dict): {month: {metric: value, ...}}; updated in place.
+        months (list): Months in chronological order.
+        detector (StreamingDetector): Detector to use (and keep for the next months).
+        metric (str): Value to score.
+        field (str): Key written into every month's dict.
+        labels (tuple): Values written for (anomaly, normal).
+
+    Returns:
+        StreamingDetector: the detector, ready to score the next month.
+    """
+    detector = detector or StreamingDetector()
+    for m in months:
+        result = detector.score(monthly[m][metric], monthly[m].get("region"))
+        monthly[m][field] = labels[0] if result["anomaly"] else labels[1]
+    return detector
+
+
+if __name__ == "__main__":
+    from chunked_csv import iter_blocks
+
+    # daily ROI per region as a stream
+    daily = StreamingDetector(window=30, warmup=10)
+    flagged = 0
+    for block in iter_blocks("data/daily_sales_data.csv"):
+        for date, region, s, sp in zip(block["date"], block["region"], block["sales"], block["marketing_spend"]):
+            result = daily.score((s - sp) / sp, region)
+            if result["anomaly"]:
+                flagged += 1
+                print(f"{str(date)[:10]}  {region:14} roi {(s - sp) / sp:6.2f}  {result['global']}")
+    print("Flagged days:", flagged)
@@ -0,0 +1,213 @@
+"""
+synthetic.py -
+
+Fast, seedable synthetic data for load testing, with the schemas and
+distributions of ex1.py (daily sales), ex3.py (daily KPIs) and mock.py.
+
+Rows are generated in chunks with NumPy's Generator. Every chunk gets its
+own random stream, derived from the seed and the chunk number with
+SeedSequence, so the data for a seed is the same whether it is written by
+one process or by many: parallel workers simply take different chunk ranges.
+Dated schemas cover the same span of days as the scripts they mimic; larger
+datasets put several rows (stores/regions) on each day instead of running
+the calendar into the far future.
+Output goes to CSV (written in bulk, one string per chunk) or to raw
+binary columns with a small JSON schema.
+
+    python src/day_6/synthetic.py daily_sales 10000000 output/load_test --workers 8
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+SCHEMAS = {
+    # ex1.py
+    "daily_sales": {
+        "start_date": "2024-01-01",
+        "days": 639,
+        "columns": {
+            "date": ("date",),
+            "region": ("choice", ["Europe", "Asia", "North America"]),
+            "sales": ("normal", 50000, 8000),
+            "marketing_spend": ("normal", 8000, 1000),
+        },
+    },
+    # ex3.py
+    "daily_kpis": {
+        "start_date": "2023-01-01",
+        "days": 639,
+        "columns": {
+            "date": ("date",),
+            "region": ("choice", ["Europe", "Asia", "North America", "Africa", "South America"]),
+            "sales": ("normal", 50000, 8000),
+            "marketing_spend": ("normal", 8000, 1000),
+            "customer_satisfaction": ("uniform", 70, 95),
+            "website_visits": ("integers", 500, 3000),
+        },
+    },
+    # mock.py
+    "mock": {
+        "columns": {
+            "category": ("choice", ["A", "B", "C", "D"]),
+            **{f"value{i}": ("uniform", 0, 1) for i in range(1, 7)},
+        },
+    },
+}
+
+
+def rows_per_day(schema, n_rows):
+    """Rows per date needed to fit n_rows into the schema's span of days."""
+    days = SCHEMAS[schema].get("days")
+    return max(1, -(-n_rows // days)) if days else 1
+
+
+def generate_chunk(schema, chunk_index, chunk_rows, n_rows, seed=42, per_day=None):
+    """
+    Generate rows [chunk_index * chunk_rows, ...) of a schema as NumPy columns.
+
+    Categorical columns are returned as integer codes into the schema's
+    category list; use `decode` to get the labels. Row i falls on day
+    i // per_day (default: `rows_per_day(schema, n_rows)`), wrapped to the
+    schema's span of days.
+    """
+    spec = SCHEMAS[schema]
+    per_day = per_day or rows_per_day(schema, n_rows)
+    first = chunk_index * chunk_rows
+    n = max(0, min(chunk_rows, n_rows - first))
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk_index,)))
+    chunk = {}
+    for name, (kind, *args) in spec["columns"].items():
+        if kind == "date":
+            day = np.arange(first, first + n) // per_day % spec["days"]
+            chunk[name] = np.datetime64(spec["start_date"], "s") + day * np.timedelta64(1, "D")
+        elif kind == "choice":
+            chunk[name] = rng.integers(0, len(args[0]), size=n, dtype=np.uint8)
+        elif kind == "normal":
+            chunk[name] = np.round(rng.normal(args[0], args[1], size=n), 2)
+        elif kind == "uniform":
+            chunk[name] = np.round(rng.uniform(args[0], args[1], size=n), 2)
+        elif kind == "integers":
+            chunk[name] = rng.integers(args[0], args[1], size=n, endpoint=True)
+    return chunk
+
+
+def iter_chunks(schema, n_rows, chunk_rows=1_000_000, seed=42, first_chunk=0, last_chunk=None, per_day=None):
+    """Yield the chunks of a dataset (optionally only chunks [first_chunk, last_chunk))."""
+    n_chunks = -(-n_rows // chunk_rows)
+    for i in range(first_chunk, n_chunks if last_chunk is None else min(last_chunk, n_chunks)):
+        yield generate_chunk(schema, i, chunk_rows, n_rows, seed, per_day)
+
+
+def decode(schema, name, codes):
+    """Labels for the integer codes of a categorical column."""
+    return np.array(SCHEMAS[schema]["columns"][name][1])[codes]
+
+
+def to_csv_text(schema, chunk):
+    """Format a chunk as CSV lines (no header) in one string."""
+    columns = []
+    for name, values in chunk.items():
+        kind = SCHEMAS[schema]["columns"][name][0]
+        if kind == "date":
+            columns.append(np.char.replace(np.datetime_as_string(values, unit="s"), "T", " "))
+        elif kind == "choice":
+            columns.append(decode(schema, name, values))
+        else:
+            columns.append(values.astype(str))
+    if not len(columns[0]):
+        return ""
+    return "\n".join(map(",".join, zip(*columns))) + "\n"
+
+
+def write_csv(path, schema, chunks):
+    """Write chunks to a CSV file with a header row; return the number of rows."""
+    rows = 0
+    with open(path, mode="w", newline="", encoding="utf-8") as f:
+        f.write(",".join(SCHEMAS[schema]["columns"]) + "\n")
+        for chunk in chunks:
+            f.write(to_csv_text(schema, chunk))
+            rows += len(next(iter(chunk.values())))
+    return rows
+
+
+def write_binary(directory, schema, chunks):
+    """Append chunks to one raw binary file per column plus schema.json; return the number of rows."""
+    os.makedirs(directory, exist_ok=True)
+    spec = SCHEMAS[schema]["columns"]
+    dtypes = {name: values.dtype.str for name, values in generate_chunk(schema, 0, 0, 0).items()}
+    files = {name: open(os.path.join(directory, f"{name}.bin"), "wb") for name in spec}
+    rows = 0
+    try:
+        for chunk in chunks:
+            for name, values in chunk.items():
+                values.tofile(files[name])
+            rows += len(next(iter(chunk.values())))
+    finally:
+        for f in files.values():
+            f.close()
+    meta = {
+        "schema": schema,
+        "rows": rows,
+        "columns": {
+            name: {"dtype": dtypes[name], **({"categories": spec[name][1]} if spec[name][0] == "choice" else {})}
+            for name in spec
+        },
+    }
+    with open(os.path.join(directory, "schema.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return rows
+
+
+def _write_part(schema, n_rows, chunk_rows, seed, first_chunk, last_chunk, path, fmt, per_day):
+    chunks = iter_chunks(schema, n_rows, chunk_rows, seed, first_chunk, last_chunk, per_day)
+    return write_csv(path, schema, chunks) if fmt == "csv" else write_binary(path, schema, chunks)
+
+
+def generate_parallel(schema, n_rows, out_dir, workers=None, chunk_rows=1_000_000, seed=42, fmt="csv",
+                      per_day=None):
+    """
+    Generate a dataset with several processes, one output part per worker.
+
+    Worker w writes a contiguous range of chunks to part-<w> (.csv file or
+    binary directory); concatenating the parts in order gives the same data
+    as a single-process run with the same seed and chunk_rows.
+    """
+    n_chunks = -(-n_rows // chunk_rows)
+    # more workers than chunks would write header-only parts
+    workers = max(1, min(workers or os.cpu_count(), n_chunks))
+    os.makedirs(out_dir, exist_ok=True)
+    bounds = [n_chunks * w // workers for w in range(workers + 1)]
+    suffix = ".csv" if fmt == "csv" else ""
+    paths = [os.path.join(out_dir, f"part-{w:03d}{suffix}") for w in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_write_part, schema, n_rows, chunk_rows, seed, bounds[w], bounds[w + 1], paths[w], fmt, per_day)
+            for w in range(workers)
+        ]
+        return sum(f.result() for f in futures)
+
+
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description="Generate synthetic load-test data.")
+    parser.add_argument("schema", choices=sorted(SCHEMAS))
+    parser.add_argument("rows", type=int)
+    parser.add_argument("out_dir")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--format", choices=["csv", "binary"], default="csv")
+    parser.add_argument("--rows-per-day", type=int, default=None,
+                        help="rows sharing each date (default: enough to fit the schema's span of days)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = generate_parallel(args.schema, args.rows, args.out_dir, args.workers, args.chunk_rows, args.seed,
+                             args.format, args.rows_per_day)
+    seconds = time.perf_counter() - start
+    print(f"{rows:,} rows in {seconds:.1f}s ({rows / seconds:,.0f} rows/s) -> {args.out_dir}")
@@ -0,0 +1,76 @@
+import sqlite3
+
+import pytest
+
+from day_02.SessionB.data_access import ConnectionPool, DataSource, QueryCache
+
+
+def connect():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE Sales (Product TEXT, Revenue REAL, Cost REAL)")
+    conn.executemany("INSERT INTO Sales VALUES (?, ?, ?)",
+                     [("Laptop", 1200, 800), ("Tablet", 500, 300), ("Phone", 800, 700)])
+    conn.commit()
+    return conn
+
+
+SQL = "SELECT Product, Revenue - Cost FROM Sales WHERE Revenue > ? ORDER BY Product"
+
+
+def test_pool_reuses_connections():
+    pool = ConnectionPool(connect, size=2)
+    for _ in range(5):
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+    assert pool.created == 1
+
+
+@pytest.mark.parametrize("error", [ValueError, KeyboardInterrupt, GeneratorExit])
+def test_pool_releases_slot_on_any_error(error):
+    pool = ConnectionPool(connect, size=1, timeout=0.1)
+    with pytest.raises(error):
+        with pool.connection():
+            raise error()
+    # the failed connection was discarded, but its slot is free again
+    with pool.connection() as conn:
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+    assert pool.created == 2
+
+
+def test_pool_times_out_when_exhausted():
+    pool = ConnectionPool(connect, size=1, timeout=0.1)
+    conn = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+    pool.release(conn)
+
+
+def test_query_is_answered_from_cache():
+    source = DataSource(ConnectionPool(connect, size=1), QueryCache(ttl=60))
+    first = source.query(SQL, (600,))
+    assert first == [("Laptop", 400.0), ("Phone", 100.0)]
+    assert source.query(SQL, (600,)) == first
+    assert (source.cache.hits, source.cache.misses) == (1, 1)
+    source.query(SQL, (400,))
+    assert source.cache.misses == 2
+
+
+def test_cached_rows_are_not_shared_with_callers():
+    source = DataSource(ConnectionPool(connect, size=1), QueryCache(ttl=60))
+    source.query(SQL, (600,)).append(("Changed", 0.0))
+    source.query(SQL, (600,)).clear()
+    assert source.query(SQL, (600,)) == [("Laptop", 400.0), ("Phone", 100.0)]
+
+
+def test_execute_clears_cache():
+    source = DataSource(ConnectionPool(connect, size=1), QueryCache(ttl=60))
+    source.query(SQL, (600,))
+    source.execute("UPDATE Sales SET Cost = ? WHERE Product = ?", (1000, "Laptop"))
+    assert source.query(SQL, (600,)) == [("Laptop", 200.0), ("Phone", 100.0)]
+
+
+def test_expired_entries_are_refetched():
+    source = DataSource(ConnectionPool(connect, size=1), QueryCache(ttl=0))
+    source.query(SQL, (600,))
+    source.query(SQL, (600,))
+    assert (source.cache.hits, source.cache.misses) == (0, 2)
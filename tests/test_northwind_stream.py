@@ -0,0 +1,55 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from day_02.SessionB.northwind_stream import create_sqlite_northwind, prefetch, stream_sales_analytics
+
+
+def test_prefetch_yields_everything_in_order():
+    assert list(prefetch(iter(range(100)), depth=3)) == list(range(100))
+
+
+def test_prefetch_stops_producer_when_consumer_stops_early():
+    produced = []
+
+    def batches():
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    threads = threading.active_count()
+    stream = prefetch(batches(), depth=2)
+    assert next(stream) == 0
+    stream.close()
+    # the producer thread has been joined and stopped well before the end
+    assert threading.active_count() == threads
+    count = len(produced)
+    time.sleep(0.3)
+    assert len(produced) == count < 1000
+
+
+def test_prefetch_reraises_producer_errors():
+    def batches():
+        yield 1
+        raise RuntimeError("fetch failed")
+
+    stream = prefetch(batches())
+    assert next(stream) == 1
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        next(stream)
+
+
+def test_stream_sales_analytics_same_with_and_without_prefetch():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    create_sqlite_northwind(conn)
+    threads = threading.active_count()
+    prefetched = stream_sales_analytics(conn.cursor(), batch_size=100, prefetch_batches=2)
+    serial = stream_sales_analytics(conn.cursor(), batch_size=100, prefetch_batches=0)
+    conn.close()
+    assert threading.active_count() == threads
+    assert prefetched.count == serial.count == 2155
+    assert prefetched.total_revenue() == pytest.approx(serial.total_revenue())
+    assert prefetched.best_product() == serial.best_product()
+    assert prefetched.profit_margins() == serial.profit_margins()
@@ -0,0 +1,65 @@
+import csv
+
+import pytest
+
+from day_02.SessionB.benchmark_xml import write_sales_xml
+from day_02.SessionB.example3 import XMLSalesAnalytics
+from day_02.SessionB.sharded_loader import aggregate_csv, aggregate_xml, load_csv, load_xml
+
+WORKERS = [1, 2, 3, 7]
+
+
+@pytest.fixture(scope="module")
+def sales_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp("csv") / "sales.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Product", "Revenue", "Cost"])
+        for i in range(2000):
+            # quoted fields with commas must not be split across shards
+            writer.writerow([f"Product {i % 7}, model {i % 3}", 100 + i, 50 + i / 2])
+    return path
+
+
+@pytest.fixture(scope="module")
+def sales_xml(tmp_path_factory):
+    path = tmp_path_factory.mktemp("xml") / "sales.xml"
+    write_sales_xml(path, 2000)
+    return path
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_load_csv_matches_dictreader(sales_csv, workers):
+    with open(sales_csv, newline="", encoding="utf-8") as f:
+        serial = list(csv.DictReader(f))
+    assert load_csv(sales_csv, workers) == serial
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_load_xml_matches_serial_loader(sales_xml, workers):
+    assert load_xml(sales_xml, workers) == XMLSalesAnalytics(sales_xml).load_xml()
+
+
+def test_load_xml_keeps_declared_encoding(tmp_path):
+    path = tmp_path / "latin1.xml"
+    sales = "".join(
+        f"<Sale><Product>Café {i}</Product><Revenue>{i + 1}</Revenue><Cost>0.5</Cost></Sale>\n" for i in range(50)
+    )
+    path.write_bytes(f'<?xml version="1.0" encoding="ISO-8859-1"?>\n<SalesData>\n{sales}</SalesData>\n'.encode("latin-1"))
+    assert load_xml(path, 3) == XMLSalesAnalytics(path).load_xml()
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_aggregates_match_serial_totals(sales_csv, sales_xml, workers):
+    xml_serial = XMLSalesAnalytics(sales_xml, stream=True).aggregates
+    xml_parallel = aggregate_xml(sales_xml, workers)
+    assert xml_parallel.count == xml_serial.count
+    assert xml_parallel.total_revenue() == pytest.approx(xml_serial.total_revenue())
+    assert xml_parallel.best_product() == xml_serial.best_product()
+    assert xml_parallel.profit_margins() == pytest.approx(xml_serial.profit_margins())
+
+    with open(sales_csv, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    csv_parallel = aggregate_csv(sales_csv, workers)
+    assert csv_parallel.count == len(rows)
+    assert csv_parallel.total_profit() == pytest.approx(sum(float(r["Revenue"]) - float(r["Cost"]) for r in rows))